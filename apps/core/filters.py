@@ -0,0 +1,42 @@
+import django_filters
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class LazyDjangoFilterBackend(DjangoFilterBackend):
+    """
+    ``DjangoFilterBackend`` that returns the queryset untouched when the
+    request carries none of the FilterSet's parameters.
+
+    Unfiltered list requests (the default browse) then skip building,
+    binding and validating a FilterSet whose every filter would be a
+    no-op anyway.  Only suitable for FilterSets whose filters all read a
+    single query parameter named after the filter (no range widgets).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is not None and request.query_params.keys().isdisjoint(
+            filterset_class.base_filters
+        ):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+
+class CachedFormFilterSet(django_filters.FilterSet):
+    """
+    ``FilterSet`` that builds its form class once per class.
+
+    django-filter otherwise creates every filter's form field and a new
+    form class for each FilterSet instance, i.e. every filtered request.
+    Form instances still deep-copy ``base_fields``, so sharing the class
+    is safe — as long as ``self.filters`` is never changed per instance
+    (no request-dependent querysets or choices).
+    """
+
+    def get_form_class(self):
+        cls = type(self)
+        form_class = cls.__dict__.get("_cached_form_class")
+        if form_class is None:
+            form_class = super().get_form_class()
+            cls._cached_form_class = form_class
+        return form_class
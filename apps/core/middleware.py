@@ -0,0 +1,53 @@
+import logging
+import socket
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyMiddleware:
+    """
+    Report each request's latency to StatsD, tagged with the view name.
+
+    Gunicorn's own StatsD metrics only see the whole request; this adds a
+    ``<prefix>.view.<view_name>`` timer so the slowest endpoints can be
+    told apart.  Datagrams are fire-and-forget UDP — a missing or slow
+    collector never delays a response.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.STATSD_PREFIX
+        host, _, port = settings.STATSD_HOST.partition(":")
+        # Resolve the collector once: ``connect`` pins the address, so
+        # ``send`` never does a DNS lookup on the request path.
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        try:
+            self.socket.connect((host, int(port or 8125)))
+        except OSError:
+            logger.warning(
+                "StatsD host %s unresolvable; latency metrics disabled.",
+                settings.STATSD_HOST,
+            )
+            self.socket.close()
+            self.socket = None
+
+    def __call__(self, request):
+        if self.socket is None:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        response = self.get_response(request)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        match = request.resolver_match
+        view_name = match.view_name if match is not None else "unresolved"
+        metric = f"{self.prefix}.view.{view_name.replace(':', '.')}:{elapsed_ms:.2f}|ms"
+        try:
+            self.socket.send(metric.encode())
+        except OSError:
+            pass
+        return response
@@ -0,0 +1,214 @@
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from django.views.decorators.http import condition
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def get_serializer_lookups(serializer_class):
+    """
+    Return ``(select_related, prefetch_related)`` lookups for a serializer.
+
+    Walks every declared field's ``source`` (``"console.name"``,
+    ``"user.get_full_name"``, nested ``GameListSerializer(many=True)``, …)
+    against the serializer's model.  Forward FK / one-to-one hops become
+    ``select_related`` lookups; anything crossing a to-many relation becomes
+    a ``prefetch_related`` lookup.  The result is cached on the serializer
+    class as ``_prefetch_cache``.
+    """
+    cached = serializer_class.__dict__.get("_prefetch_cache")
+    if cached is not None:
+        return cached
+
+    select, prefetch = set(), set()
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    if model is not None:
+        _collect_lookups(serializer_class(), model, [], False, select, prefetch)
+
+    lookups = (tuple(sorted(select)), tuple(sorted(prefetch)))
+    serializer_class._prefetch_cache = lookups
+    return lookups
+
+
+def _collect_lookups(serializer, model, prefix, many, select, prefetch):
+    for field in serializer.fields.values():
+        if field.source == "*":
+            continue
+
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        is_nested = isinstance(nested, serializers.BaseSerializer)
+
+        path = list(prefix)
+        path_many = many
+        current = model
+        attrs = field.source.split(".")
+        walked = 0
+        last_hop = None
+
+        for attr in attrs:
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break
+            if not model_field.is_relation or model_field.related_model is None:
+                break
+            path.append(attr)
+            path_many = path_many or model_field.many_to_many or model_field.one_to_many
+            current = model_field.related_model
+            last_hop = model_field
+            walked += 1
+
+        fully_walked = walked == len(attrs)
+
+        # A plain PK field (``console``) only needs ``console_id`` — no join.
+        if (
+            fully_walked
+            and not is_nested
+            and last_hop is not None
+            and not (last_hop.many_to_many or last_hop.one_to_many)
+        ):
+            path.pop()
+
+        if len(path) > len(prefix):
+            lookup = "__".join(path)
+            (prefetch if path_many else select).add(lookup)
+
+        if is_nested and fully_walked and walked:
+            _collect_lookups(nested, current, path, path_many, select, prefetch)
+
+
+class AutoPrefetchMixin:
+    """
+    Apply ``select_related`` / ``prefetch_related`` derived from the
+    serializer returned by ``get_serializer_class()`` for the current action.
+
+    Views that scope the queryset per request should set ``queryset`` and
+    call ``super().get_queryset()`` rather than building it from scratch.
+
+    ``prefetch_querysets`` maps a prefetch lookup to the queryset used to
+    fetch it — e.g. an ``.only()`` projection of the nested serializer's
+    columns.  Lookups not listed use the related model's default manager.
+    """
+
+    prefetch_querysets = {}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select, prefetch = get_serializer_lookups(self.get_serializer_class())
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*(
+                Prefetch(lookup, queryset=self.prefetch_querysets[lookup])
+                if lookup in self.prefetch_querysets
+                else lookup
+                for lookup in prefetch
+            ))
+        return queryset
+
+
+class ActionSerializerMixin:
+    """
+    Pick the serializer from a class-level ``serializer_classes`` map
+    keyed by ``self.action``, falling back to ``serializer_class``.
+    """
+
+    serializer_classes = {}
+
+    def get_serializer_class(self):
+        return self.serializer_classes.get(self.action) or super().get_serializer_class()
+
+
+_filter_backend_instances = {}
+
+
+class SharedFilterBackendsMixin:
+    """
+    Reuse one instance per filter backend class instead of building a
+    fresh ``DjangoFilterBackend()`` / ``SearchFilter()`` /
+    ``OrderingFilter()`` on every request.  The stock backends keep no
+    per-request state on ``self``.
+    """
+
+    def filter_queryset(self, queryset):
+        for backend_class in self.filter_backends:
+            backend = _filter_backend_instances.get(backend_class)
+            if backend is None:
+                backend = _filter_backend_instances.setdefault(backend_class, backend_class())
+            queryset = backend.filter_queryset(self.request, queryset, self)
+        return queryset
+
+
+class LastModifiedMixin:
+    """
+    Answer conditional ``list`` / ``retrieve`` requests with
+    ``304 Not Modified`` when nothing changed since ``If-Modified-Since``
+    (or the weak ``ETag`` sent back in ``If-None-Match``), skipping the
+    queryset and serialization entirely.
+
+    Subclasses implement ``get_last_modified()`` (an aware ``datetime`` or
+    ``None`` to disable the check) and may override ``get_etag()`` with a
+    finer-grained token.  Custom read-only actions can opt in by routing
+    through ``_conditional``.
+    """
+
+    def get_last_modified(self):
+        return None
+
+    def get_etag(self, last_modified):
+        return f'W/"{int(last_modified.timestamp())}"'
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        last_modified = self.get_last_modified()
+        if last_modified is None:
+            return handler(request, *args, **kwargs)
+        etag = self.get_etag(last_modified)
+        conditional = condition(
+            etag_func=lambda *_args, **_kwargs: etag,
+            last_modified_func=lambda *_args, **_kwargs: last_modified,
+        )
+        return conditional(handler)(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
+
+
+class CachedObjectMixin:
+    """
+    Memoise ``get_object()`` for the life of the view instance — DRF
+    builds one per request, so repeat calls (custom actions, permission
+    helpers, the browsable API) reuse the first lookup.
+    """
+
+    def get_object(self):
+        obj = self.__dict__.get("_cached_object")
+        if obj is None:
+            obj = self._cached_object = super().get_object()
+        return obj
+
+
+class ReadReplicaMixin:
+    """
+    Read safe-method requests from the ``replica`` database when one is
+    configured; writes and every other request stay on ``default``.
+
+    ``replica_actions`` limits this to the named actions (``None`` — all
+    safe-method actions).  Only for views that tolerate replication lag.
+    """
+
+    replica_alias = "replica"
+    replica_actions = None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if (
+            self.replica_alias in settings.DATABASES
+            and self.request.method in SAFE_METHODS
+            and (self.replica_actions is None or self.action in self.replica_actions)
+        ):
+            queryset = queryset.using(self.replica_alias)
+        return queryset
@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class StandardResultsPagination(PageNumberPagination):
@@ -17,3 +17,12 @@ class LargeResultsPagination(PageNumberPagination):
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 200
+
+
+class NewestFirstCursorPagination(CursorPagination):
+    """Keyset pagination on ``-created_at`` — deep pages cost no OFFSET scan."""
+
+    ordering = "-created_at"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
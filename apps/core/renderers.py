@@ -1,4 +1,6 @@
-from rest_framework.renderers import JSONRenderer
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
 
 
 class CustomJSONRenderer(JSONRenderer):
@@ -17,3 +19,28 @@ class CustomJSONRenderer(JSONRenderer):
             "data": data,
         }
         return super().render(wrapped, accepted_media_type, renderer_context)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Drop-in for DRF's ``JSONRenderer`` backed by ``orjson``.
+
+    Types orjson can't encode natively (``Decimal``, lazy translation
+    strings, …) fall back to DRF's ``JSONEncoder.default``.  Non-string
+    dict keys (e.g. the review rating breakdown) are allowed, as with
+    the stdlib encoder.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(
+            data,
+            default=self._encoder.default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
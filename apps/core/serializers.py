@@ -0,0 +1,169 @@
+import copy
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.fields import Field, SkipField, is_simple_callable
+from rest_framework.relations import (
+    MANY_RELATION_KWARGS,
+    ManyRelatedField,
+    PKOnlyObject,
+    PrimaryKeyRelatedField,
+)
+
+
+def _identity(instance):
+    return instance
+
+
+def _compile_getter(attr):
+    def getter(instance):
+        value = getattr(instance, attr)
+        return value() if is_simple_callable(value) else value
+
+    return getter
+
+
+class CompiledRepresentationMixin:
+    """
+    Faster ``to_representation`` for fixed-shape, read-mostly serializers.
+
+    The first call builds a per-class map of plain attribute getters for
+    every readable field whose source is a single attribute (or ``"*"``)
+    and that doesn't override ``get_attribute``.  Rows then read those
+    attributes directly instead of going through DRF's generic
+    ``Field.get_attribute`` walk.  Dotted sources, related fields and
+    nested serializers keep the stock path.
+    """
+
+    def _get_compiled_getters(self):
+        cls = type(self)
+        getters = cls.__dict__.get("_compiled_getters")
+        if getters is None:
+            getters = {}
+            for field in self._readable_fields:
+                if type(field).get_attribute is not Field.get_attribute:
+                    continue
+                if field.source == "*":
+                    getters[field.field_name] = _identity
+                elif len(field.source_attrs) == 1:
+                    getters[field.field_name] = _compile_getter(field.source)
+            cls._compiled_getters = getters
+        return getters
+
+    def to_representation(self, instance):
+        getters = self._get_compiled_getters()
+        ret = {}
+
+        for field in self._readable_fields:
+            getter = getters.get(field.field_name)
+            if getter is not None:
+                attribute = getter(instance)
+            else:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+
+        return ret
+
+
+class CachedFieldsMixin:
+    """
+    Build a ``ModelSerializer``'s fields once per class.
+
+    ``ModelSerializer.get_fields`` introspects the model and builds every
+    field from scratch for each serializer instance.  The result only
+    depends on the class, so it is computed once and each instance gets a
+    deep copy — the same cheap ``Field.__deepcopy__`` re-instantiation DRF
+    already uses for declared fields, which keeps bound fields per instance.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
+
+
+_shared_serializers = {}
+
+
+def get_shared_serializer(serializer_class):
+    """
+    Return one shared, context-free ``serializer_class`` instance per process.
+
+    Only for read-only serializers whose fields don't depend on
+    ``context`` (no request, no hyperlinked fields).
+    """
+    serializer = _shared_serializers.get(serializer_class)
+    if serializer is None:
+        serializer = _shared_serializers.setdefault(serializer_class, serializer_class())
+    return serializer
+
+
+def represent_many(serializer_class, instances):
+    """
+    Serialize ``instances`` with the shared ``serializer_class`` instance.
+
+    Skips the per-call construction and field binding of
+    ``serializer_class(instances, many=True)``.
+    """
+    serializer = get_shared_serializer(serializer_class)
+    return [serializer.to_representation(instance) for instance in instances]
+
+
+class BulkManyRelatedField(ManyRelatedField):
+    """
+    ``ManyRelatedField`` that resolves every primary key in one query.
+
+    DRF's version calls the child's ``to_internal_value`` per item, i.e.
+    one ``SELECT`` per id.  This one validates the ids up front, loads
+    them with a single ``in_bulk`` and reports unknown ids with the
+    child's usual ``does_not_exist`` error.  Input order is preserved.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        child = self.child_relation
+        queryset = child.get_queryset()
+        pk_field = queryset.model._meta.pk
+
+        pks = []
+        for item in data:
+            if child.pk_field is not None:
+                item = child.pk_field.to_internal_value(item)
+            try:
+                if isinstance(item, bool):
+                    raise TypeError
+                pks.append(pk_field.to_python(item))
+            except (TypeError, ValueError, DjangoValidationError):
+                child.fail("incorrect_type", data_type=type(item).__name__)
+
+        objects = queryset.in_bulk(pks)
+        for pk in pks:
+            if pk not in objects:
+                child.fail("does_not_exist", pk_value=pk)
+        return [objects[pk] for pk in pks]
+
+
+class BulkPrimaryKeyRelatedField(PrimaryKeyRelatedField):
+    """``PrimaryKeyRelatedField`` whose ``many=True`` form batches its lookups."""
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
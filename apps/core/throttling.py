@@ -0,0 +1,60 @@
+from functools import lru_cache
+
+from rest_framework import throttling
+
+
+@lru_cache(maxsize=None)
+def _parse_rate(rate):
+    # ``SimpleRateThrottle.parse_rate`` doesn't touch ``self``; throttles
+    # are built per request, so parse each configured rate only once.
+    return throttling.SimpleRateThrottle.parse_rate(None, rate)
+
+
+class FixedWindowRateThrottleMixin:
+    """
+    Count requests with one atomic cache ``incr`` per request.
+
+    DRF's ``SimpleRateThrottle`` keeps a timestamp list per client and
+    does a ``get`` and a ``set`` on every request, which both costs two
+    round trips and lets concurrent requests overwrite each other's
+    history.  Here each client gets one counter per fixed window (the key
+    carries the window number and expires with it), so the common case is
+    a single ``incr``.  A burst straddling two windows can see up to twice
+    the rate, the usual fixed-window trade-off.
+    """
+
+    def parse_rate(self, rate):
+        return _parse_rate(rate)
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        return self._increment() <= self.num_requests
+
+    def _increment(self):
+        key = f"{self.key}:{int(self.now // self.duration)}"
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # First request in this window.  ``add`` loses to a concurrent
+            # first request at most once, after which ``incr`` succeeds.
+            if self.cache.add(key, 1, self.duration):
+                return 1
+            return self.cache.incr(key)
+
+    def wait(self):
+        return self.duration - (self.now % self.duration)
+
+
+class AnonRateThrottle(FixedWindowRateThrottleMixin, throttling.AnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(FixedWindowRateThrottleMixin, throttling.UserRateThrottle):
+    pass
@@ -36,13 +36,17 @@ PostgreSQL.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
 from dataclasses import dataclass
 from datetime import date
 from typing import Sequence
 from uuid import UUID
 
-from django.db.models import Count, Q
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import CharField, Count, Q, Value
 
 from .models import (
     Accessory,
@@ -63,6 +67,11 @@ BLOCKING_STATUSES = {
     RentalStatus.OVERDUE,
 }
 
+CONSOLE_INTERVALS_CACHE_TIMEOUT = 60 * 5  # seconds
+CART_COUNTS_CACHE_TIMEOUT = 60  # seconds
+
+_AVAILABILITY_VERSION_KEY = "avail:version"
+
 
 # ═══════════════════════════════════════════════════════════════════
 # DATA CLASSES
@@ -90,6 +99,19 @@ class AvailabilityResult:
             f"({self.overlapping_rentals} overlapping rental(s))"
         )
 
+    def as_dict(self) -> dict:
+        """JSON-ready dict, same shape as ``AvailabilityItemSerializer``."""
+        return {
+            "item_id": str(self.item_id),
+            "item_type": self.item_type,
+            "item_name": self.item_name,
+            "is_available": self.is_available,
+            "stock_quantity": self.stock_quantity,
+            "overlapping_rentals": self.overlapping_rentals,
+            "available_for_dates": self.available_for_dates,
+            "reason": self.reason,
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class BulkAvailabilityResult:
@@ -117,6 +139,15 @@ class BulkAvailabilityResult:
         items.extend(a for a in self.accessories if not a.is_available)
         return items
 
+    def as_dict(self) -> dict:
+        """JSON-ready dict, same shape as ``BulkAvailabilitySerializer``."""
+        return {
+            "all_available": self.all_available,
+            "console": self.console.as_dict() if self.console else None,
+            "games": [g.as_dict() for g in self.games],
+            "accessories": [a.as_dict() for a in self.accessories],
+        }
+
 
 # ═══════════════════════════════════════════════════════════════════
 # OVERLAP QUERY HELPERS
@@ -219,6 +250,130 @@ def _count_overlapping_accessory_rentals(
     return {row["accessories__id"]: row["cnt"] for row in rows}
 
 
+def _count_overlapping_cart_rentals(
+    console_id: UUID | None,
+    game_ids: Sequence[UUID],
+    accessory_ids: Sequence[UUID],
+    start: date,
+    end: date,
+    *,
+    exclude_rental_id: UUID | None = None,
+) -> dict[tuple[str, UUID], int]:
+    """
+    Overlap counts for a whole cart in *one* round trip.
+
+    The per-type aggregates are combined with ``UNION ALL``; the result is
+    keyed by ``(item_type, item_id)``.  Items with no overlapping rental
+    are simply absent.
+    """
+    base = Rental.objects.filter(_blocking_overlap_q(start, end))
+    if exclude_rental_id:
+        base = base.exclude(pk=exclude_rental_id)
+
+    def _grouped(qs, key: str, item_type: str):
+        return (
+            qs.order_by()
+            .values(key)
+            .annotate(
+                item_type=Value(item_type, output_field=CharField()),
+                cnt=Count("id", distinct=True),
+            )
+            .values_list("item_type", key, "cnt")
+        )
+
+    parts = []
+    if console_id:
+        parts.append(_grouped(base.filter(console_id=console_id), "console_id", "console"))
+    if game_ids:
+        parts.append(_grouped(base.filter(games__id__in=game_ids), "games__id", "game"))
+    if accessory_ids:
+        parts.append(
+            _grouped(base.filter(accessories__id__in=accessory_ids), "accessories__id", "accessory")
+        )
+    if not parts:
+        return {}
+
+    combined = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+    return {(item_type, item_id): cnt for item_type, item_id, cnt in combined}
+
+
+# ── Cached console intervals ────────────────────────────────────
+# The public ``check-availability`` endpoint is polled by calendar
+# widgets.  Each console's blocking ``(start, end)`` pairs are cached
+# (shared across workers) and overlaps are counted in Python; rental
+# writes invalidate the entry via ``signals.py``.  Booking creation
+# keeps checking against the database.
+
+def _console_intervals_cache_key(console_id) -> str:
+    return f"avail:console:{console_id}"
+
+
+def _get_console_intervals(console_id: UUID) -> list[tuple[date, date]]:
+    return cache.get_or_set(
+        _console_intervals_cache_key(console_id),
+        lambda: list(
+            Rental.objects
+            .filter(console_id=console_id, status__in=BLOCKING_STATUSES)
+            .order_by()
+            .values_list("rental_start_date", "rental_end_date")
+        ),
+        CONSOLE_INTERVALS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_console_intervals(console_id: UUID | None) -> None:
+    """Drop a console's cached intervals once the current transaction commits."""
+    if console_id is None:
+        return
+    key = _console_intervals_cache_key(console_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+# ── Cached cart overlap counts ──────────────────────────────────
+# Cart checks from the public availability endpoint cache their overlap
+# counts per (items, date range).  Every key carries a shared version
+# that any rental write bumps, so no cached range has to be enumerated
+# on invalidation.  Booking validation never reads these entries.
+
+def invalidate_availability() -> None:
+    """Supersede every cached cart count once the current transaction commits."""
+    transaction.on_commit(
+        lambda: cache.set(_AVAILABILITY_VERSION_KEY, time.time_ns(), timeout=None)
+    )
+
+
+def _cart_counts_cache_key(
+    console_id: UUID | None,
+    game_ids: Sequence[UUID],
+    accessory_ids: Sequence[UUID],
+    start: date,
+    end: date,
+) -> str:
+    version = cache.get_or_set(_AVAILABILITY_VERSION_KEY, time.time_ns, timeout=None)
+    raw = "|".join((
+        str(console_id or ""),
+        ",".join(sorted(map(str, game_ids))),
+        ",".join(sorted(map(str, accessory_ids))),
+        start.isoformat(),
+        end.isoformat(),
+    ))
+    digest = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    return f"avail:cart:{version}:{digest}"
+
+
+def _build_result(item, item_type: str, overlapping: int) -> AvailabilityResult:
+    available_for_dates = item.stock_quantity - overlapping
+    return AvailabilityResult(
+        item_id=item.pk,
+        item_type=item_type,
+        item_name=str(item),
+        is_available=available_for_dates > 0,
+        stock_quantity=item.stock_quantity,
+        overlapping_rentals=overlapping,
+        available_for_dates=max(available_for_dates, 0),
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════
 # PUBLIC API — single-item checks
 # ═══════════════════════════════════════════════════════════════════
@@ -243,7 +398,8 @@ def check_console_availability(
         ``end`` and can be re-rented the same day).
     exclude_rental_id : UUID, optional
         If supplied, excludes this rental from the overlap count (useful when
-        editing an existing booking).
+        editing an existing booking).  Such checks always hit the database;
+        plain checks use the cached interval list.
 
     Returns
     -------
@@ -252,9 +408,16 @@ def check_console_availability(
     if end <= start:
         raise ValueError("end date must be after start date")
 
-    overlapping = _count_overlapping_console_rentals(
-        console.pk, start, end, exclude_rental_id=exclude_rental_id,
-    )
+    if exclude_rental_id:
+        overlapping = _count_overlapping_console_rentals(
+            console.pk, start, end, exclude_rental_id=exclude_rental_id,
+        )
+    else:
+        overlapping = sum(
+            1
+            for rental_start, rental_end in _get_console_intervals(console.pk)
+            if rental_start < end and rental_end > start
+        )
     available_for_dates = console.stock_quantity - overlapping
 
     return AvailabilityResult(
@@ -337,15 +500,16 @@ def check_bulk_availability(
     start: date,
     end: date,
     exclude_rental_id: UUID | None = None,
+    cached: bool = False,
 ) -> BulkAvailabilityResult:
     """
     Check availability for an entire rental cart in the fewest DB hits.
 
-    Queries performed:
-        1 query  for the console        (if present)
-        1 query  for all games           (aggregated)
-        1 query  for all accessories     (aggregated)
-    = max 3 queries regardless of cart size.
+    The console, game and accessory overlap counts are fetched together
+    in a single ``UNION ALL`` query regardless of cart size.  With
+    ``cached=True`` the counts are read from (and stored in) the cache
+    for ``CART_COUNTS_CACHE_TIMEOUT`` seconds — for read-only previews
+    only; bookings must check against the database.
 
     Returns
     -------
@@ -358,56 +522,42 @@ def check_bulk_availability(
     games = list(games or [])
     accessories = list(accessories or [])
 
-    # ── Console ──────────────────────────────────────────────────
-    console_result: AvailabilityResult | None = None
-    if console:
-        console_result = check_console_availability(
-            console, start, end, exclude_rental_id=exclude_rental_id,
+    console_id = console.pk if console else None
+    game_ids = [g.pk for g in games]
+    accessory_ids = [a.pk for a in accessories]
+
+    def _counts():
+        return _count_overlapping_cart_rentals(
+            console_id,
+            game_ids,
+            accessory_ids,
+            start,
+            end,
+            exclude_rental_id=exclude_rental_id,
         )
 
-    # ── Games (single query for all) ────────────────────────────
-    game_results: list[AvailabilityResult] = []
-    if games:
-        game_ids = [g.pk for g in games]
-        counts = _count_overlapping_game_rentals(
-            game_ids, start, end, exclude_rental_id=exclude_rental_id,
+    if cached and not exclude_rental_id:
+        counts = cache.get_or_set(
+            _cart_counts_cache_key(console_id, game_ids, accessory_ids, start, end),
+            _counts,
+            CART_COUNTS_CACHE_TIMEOUT,
         )
-        for game in games:
-            overlapping = counts.get(game.pk, 0)
-            avail = game.stock_quantity - overlapping
-            game_results.append(
-                AvailabilityResult(
-                    item_id=game.pk,
-                    item_type="game",
-                    item_name=str(game),
-                    is_available=avail > 0,
-                    stock_quantity=game.stock_quantity,
-                    overlapping_rentals=overlapping,
-                    available_for_dates=max(avail, 0),
-                )
-            )
+    else:
+        counts = _counts()
 
-    # ── Accessories (single query for all) ──────────────────────
-    accessory_results: list[AvailabilityResult] = []
-    if accessories:
-        acc_ids = [a.pk for a in accessories]
-        counts = _count_overlapping_accessory_rentals(
-            acc_ids, start, end, exclude_rental_id=exclude_rental_id,
+    console_result: AvailabilityResult | None = None
+    if console:
+        console_result = _build_result(
+            console, "console", counts.get(("console", console.pk), 0),
         )
-        for acc in accessories:
-            overlapping = counts.get(acc.pk, 0)
-            avail = acc.stock_quantity - overlapping
-            accessory_results.append(
-                AvailabilityResult(
-                    item_id=acc.pk,
-                    item_type="accessory",
-                    item_name=str(acc),
-                    is_available=avail > 0,
-                    stock_quantity=acc.stock_quantity,
-                    overlapping_rentals=overlapping,
-                    available_for_dates=max(avail, 0),
-                )
-            )
+    game_results = [
+        _build_result(game, "game", counts.get(("game", game.pk), 0))
+        for game in games
+    ]
+    accessory_results = [
+        _build_result(acc, "accessory", counts.get(("accessory", acc.pk), 0))
+        for acc in accessories
+    ]
 
     result = BulkAvailabilityResult(
         console=console_result,
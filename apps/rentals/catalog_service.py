@@ -0,0 +1,96 @@
+"""
+Catalog Service
+===============
+Tracks when the public catalog (consoles, games, accessories and the
+review aggregates shown on console pages) last changed, so the catalog
+viewsets can answer conditional GETs with ``304 Not Modified``.
+
+The timestamp lives in the shared cache rather than being derived from
+``MAX(updated_at)``: stock moves are bulk ``UPDATE`` s that don't bump
+``updated_at``, and a cache read keeps the check O(1).
+
+Alongside it, a nanosecond ``version`` changes on every write — even
+two in the same second — and keys the weak ETags and the cached public
+list pages, so a catalog change supersedes every cached page at once.
+"""
+
+import hashlib
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db import transaction
+
+CATALOG_LAST_MODIFIED_KEY = "catalog:last_modified"
+CATALOG_VERSION_KEY = "catalog:version"
+CATALOG_PAGE_CACHE_TIMEOUT = 60 * 5  # seconds
+
+
+def _stamp() -> int:
+    # HTTP dates have one-second resolution; rounding up means a client
+    # that fetched earlier in the same second never gets a stale 304.
+    return int(time.time()) + 1
+
+
+def _current_stamp() -> int:
+    stamp = cache.get(CATALOG_LAST_MODIFIED_KEY)
+    if stamp is None:
+        stamp = _stamp()
+        cache.add(CATALOG_LAST_MODIFIED_KEY, stamp, timeout=None)
+    return stamp
+
+
+def get_catalog_last_modified() -> datetime:
+    """Return the last catalog change, seeding the cache with *now* if empty."""
+    return datetime.fromtimestamp(_current_stamp(), tz=dt_timezone.utc)
+
+
+def get_catalog_version() -> int:
+    """Return an opaque token that changes on every catalog write."""
+    return cache.get_or_set(CATALOG_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def get_catalog_state() -> tuple[datetime, int]:
+    """
+    Return ``(last_modified, version)`` in a single cache round trip.
+
+    A conditional catalog request needs both; fetching them with one
+    ``get_many`` instead of two ``get`` calls saves a Redis RTT.
+    """
+    values = cache.get_many([CATALOG_LAST_MODIFIED_KEY, CATALOG_VERSION_KEY])
+    stamp = values.get(CATALOG_LAST_MODIFIED_KEY)
+    if stamp is None:
+        stamp = _current_stamp()
+    version = values.get(CATALOG_VERSION_KEY)
+    if version is None:
+        version = get_catalog_version()
+    return datetime.fromtimestamp(stamp, tz=dt_timezone.utc), version
+
+
+def get_cached_catalog_page(page_url: str, build, version: int | None = None):
+    """
+    Return the cached payload for one public catalog list page.
+
+    ``page_url`` is the full request URL (filters, ordering, page);
+    ``build`` produces the payload on a miss.  Keyed on the catalog
+    ``version`` (looked up if not given), so entries never outlive a
+    catalog change.
+    """
+    if version is None:
+        version = get_catalog_version()
+    digest = hashlib.md5(page_url.encode()).hexdigest()
+    return cache.get_or_set(
+        f"catalog:page:{version}:{digest}",
+        build,
+        CATALOG_PAGE_CACHE_TIMEOUT,
+    )
+
+
+def touch_catalog() -> None:
+    """Record a catalog change once the current transaction commits."""
+    transaction.on_commit(
+        lambda: cache.set_many(
+            {CATALOG_LAST_MODIFIED_KEY: _stamp(), CATALOG_VERSION_KEY: time.time_ns()},
+            timeout=None,
+        )
+    )
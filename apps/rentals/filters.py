@@ -13,6 +13,8 @@ string — e.g.  ``?daily_price_min=500&daily_price_max=1500``.
 import django_filters
 from django.db.models import Q
 
+from apps.core.filters import CachedFormFilterSet
+
 from .models import (
     Accessory,
     Console,
@@ -26,7 +28,7 @@ from .models import (
 # CONSOLE
 # ═══════════════════════════════════════════════════════════════════
 
-class ConsoleFilter(django_filters.FilterSet):
+class ConsoleFilter(CachedFormFilterSet):
     """
     Filterable fields
     -----------------
@@ -62,7 +64,7 @@ class ConsoleFilter(django_filters.FilterSet):
 # GAME
 # ═══════════════════════════════════════════════════════════════════
 
-class GameFilter(django_filters.FilterSet):
+class GameFilter(CachedFormFilterSet):
     """
     Filterable fields
     -----------------
@@ -111,7 +113,7 @@ class GameFilter(django_filters.FilterSet):
 # ACCESSORY
 # ═══════════════════════════════════════════════════════════════════
 
-class AccessoryFilter(django_filters.FilterSet):
+class AccessoryFilter(CachedFormFilterSet):
     """
     Filterable fields
     -----------------
@@ -147,7 +149,7 @@ class AccessoryFilter(django_filters.FilterSet):
 # RENTAL
 # ═══════════════════════════════════════════════════════════════════
 
-class RentalFilter(django_filters.FilterSet):
+class RentalFilter(CachedFormFilterSet):
     """
     Filterable fields
     -----------------
@@ -191,7 +193,7 @@ class RentalFilter(django_filters.FilterSet):
 # REVIEW
 # ═══════════════════════════════════════════════════════════════════
 
-class ReviewFilter(django_filters.FilterSet):
+class ReviewFilter(CachedFormFilterSet):
     """
     Filterable fields
     -----------------
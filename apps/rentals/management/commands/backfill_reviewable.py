@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.rentals.models import Rental, RentalStatus
+
+
+class Command(BaseCommand):
+    help = "Mark returned, not-yet-reviewed rentals as reviewable (one-off after adding the flag)"
+
+    def handle(self, *args, **options):
+        updated = (
+            Rental.objects
+            .filter(status=RentalStatus.RETURNED, is_reviewable=False, review__isnull=True)
+            .update(is_reviewable=True)
+        )
+        self.stdout.write(self.style.SUCCESS(f"Marked {updated} rental(s) reviewable."))
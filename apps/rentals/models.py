@@ -134,6 +134,7 @@ class Console(BaseModel):
             models.Index(fields=["console_type"], name="idx_console_type"),
             models.Index(fields=["is_active", "available_quantity"], name="idx_console_availability"),
             models.Index(fields=["daily_price"], name="idx_console_price"),
+            models.Index(fields=["is_active", "-created_at"], name="idx_console_active_recent"),
         ]
 
     def __str__(self):
@@ -227,6 +228,7 @@ class Game(BaseModel):
             models.Index(fields=["genre"], name="idx_game_genre"),
             models.Index(fields=["is_active", "available_quantity"], name="idx_game_availability"),
             models.Index(fields=["rating"], name="idx_game_rating"),
+            models.Index(fields=["is_active", "-created_at"], name="idx_game_active_recent"),
         ]
 
     def __str__(self):
@@ -291,6 +293,7 @@ class Accessory(BaseModel):
         indexes = [
             models.Index(fields=["category"], name="idx_accessory_category"),
             models.Index(fields=["is_active", "available_quantity"], name="idx_accessory_availability"),
+            models.Index(fields=["is_active", "-created_at"], name="idx_accessory_active_recent"),
         ]
 
     def __str__(self):
@@ -381,6 +384,9 @@ class Rental(BaseModel):
 
     # ── Tracking ─────────────────────────────────────────────────
     rental_number = models.CharField("rental number", max_length=20, unique=True)
+    # Denormalised "returned and not yet reviewed" — kept in step by the
+    # service layer and the Review signals.
+    is_reviewable = models.BooleanField("reviewable", default=False)
 
     class Meta(BaseModel.Meta):
         verbose_name = "rental"
@@ -389,10 +395,16 @@ class Rental(BaseModel):
         indexes = [
             models.Index(fields=["status"], name="idx_rental_status"),
             models.Index(fields=["rental_number"], name="idx_rental_number"),
-            models.Index(fields=["user", "status"], name="idx_rental_user_status"),
             models.Index(fields=["rental_start_date", "rental_end_date"], name="idx_rental_dates"),
             models.Index(fields=["rental_type"], name="idx_rental_type"),
             models.Index(fields=["payment_status"], name="idx_rental_payment"),
+            # ── User rental lists (newest first) ────────────────
+            models.Index(fields=["user", "-created_at"], name="idx_rental_user_recent"),
+            models.Index(
+                fields=["user", "status", "-created_at"],
+                name="idx_rental_user_status",
+            ),
+            models.Index(fields=["user", "is_reviewable"], name="idx_rental_user_reviewable"),
             # ── Availability overlap queries ────────────────────
             models.Index(
                 fields=["console", "status", "rental_start_date", "rental_end_date"],
@@ -402,11 +414,29 @@ class Rental(BaseModel):
                 fields=["status", "rental_start_date", "rental_end_date"],
                 name="idx_rental_status_dates",
             ),
+            # ── Celery task filters ─────────────────────────────
+            models.Index(
+                fields=["status", "rental_end_date"],
+                name="idx_rental_status_end",
+            ),
+            models.Index(
+                fields=["status", "late_fee"],
+                name="idx_rental_status_fee",
+            ),
         ]
 
     def __str__(self):
         return f"Rental #{self.rental_number} – {self.user.email}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded status so the pre_save signal can detect a
+        # transition without re-reading the row.
+        if "status" in field_names:
+            instance._prev_status = values[field_names.index("status")]
+        return instance
+
     def clean(self):
         if self.rental_start_date and self.rental_end_date:
             if self.rental_end_date <= self.rental_start_date:
@@ -512,6 +542,7 @@ class Review(BaseModel):
         ]
         indexes = [
             models.Index(fields=["console", "rating"], name="idx_review_console_rating"),
+            models.Index(fields=["console", "-created_at"], name="idx_review_console_recent"),
             models.Index(fields=["user", "-created_at"], name="idx_review_user_recent"),
             models.Index(fields=["is_verified", "rating"], name="idx_review_verified_rating"),
         ]
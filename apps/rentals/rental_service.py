@@ -9,12 +9,14 @@ stay thin and only handle HTTP concerns.
 from __future__ import annotations
 
 import logging
-import uuid
+import secrets
 from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from django.db import models, transaction
+from django.db.models import Case, Count, ExpressionWrapper, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 if TYPE_CHECKING:
@@ -22,6 +24,7 @@ if TYPE_CHECKING:
 
     User = get_user_model()
 
+from . import catalog_service
 from .models import (
     Accessory,
     Console,
@@ -31,6 +34,7 @@ from .models import (
     Rental,
     RentalStatus,
     RentalType,
+    Review,
 )
 
 logger = logging.getLogger(__name__)
@@ -98,20 +102,27 @@ def calculate_rental_price(
         )
 
     # ── Games ────────────────────────────────────────────────────
+    # Bucket pricing is linear in the rates, so the cart's rates are
+    # summed first and priced once.
     games_price = Decimal("0.00")
-    for game in games:
-        games_price += _price_for_item(
-            daily=game.daily_price,
-            weekly=game.weekly_price or game.daily_price * 7,
-            monthly=game.daily_price * 30,
+    if games:
+        games_daily = sum((game.daily_price for game in games), Decimal("0.00"))
+        games_price = _price_for_item(
+            daily=games_daily,
+            weekly=sum(
+                (game.weekly_price or game.daily_price * 7 for game in games),
+                Decimal("0.00"),
+            ),
+            monthly=games_daily * 30,
             rental_type=rental_type,
             duration_days=duration_days,
         )
 
     # ── Accessories ──────────────────────────────────────────────
-    accessories_price = Decimal("0.00")
-    for acc in accessories:
-        accessories_price += acc.price_per_day * Decimal(duration_days)
+    accessories_price = (
+        sum((acc.price_per_day for acc in accessories), Decimal("0.00"))
+        * Decimal(duration_days)
+    )
 
     total_price = console_price + games_price + accessories_price
 
@@ -153,42 +164,60 @@ def _price_for_item(
 
 
 def _decrement_stock(rental: Rental) -> None:
-    """Atomically reduce ``available_quantity`` for every item in the rental."""
+    """
+    Atomically reduce ``available_quantity`` for every item in the rental.
+
+    Each item type is a single guarded ``UPDATE … WHERE available_quantity >= 1``.
+    If fewer rows match than were requested, an item sold out between
+    validation and commit — ``ValueError`` rolls back the caller's transaction.
+    """
     if rental.console_id:
-        Console.objects.filter(pk=rental.console_id).update(
-            available_quantity=models.F("available_quantity") - 1,
-        )
+        _guarded_decrement(Console, [rental.console_id])
+    _guarded_decrement(Game, list(rental.games.values_list("pk", flat=True)))
+    _guarded_decrement(Accessory, list(rental.accessories.values_list("pk", flat=True)))
 
-    for game in rental.games.all():
-        Game.objects.filter(pk=game.pk).update(
-            available_quantity=models.F("available_quantity") - 1,
-        )
+    catalog_service.touch_catalog()
+    logger.info("Stock decremented for rental %s", rental.rental_number)
 
-    for acc in rental.accessories.all():
-        Accessory.objects.filter(pk=acc.pk).update(
-            available_quantity=models.F("available_quantity") - 1,
-        )
 
-    logger.info("Stock decremented for rental %s", rental.rental_number)
+def _guarded_decrement(model, ids: list) -> None:
+    """Decrement stock for ``ids`` in one UPDATE; raise if any row is short."""
+    if not ids:
+        return
+
+    updated = model.objects.filter(
+        pk__in=ids,
+        is_active=True,
+        available_quantity__gte=1,
+    ).update(
+        available_quantity=models.F("available_quantity") - 1,
+    )
+    if updated != len(ids):
+        raise ValueError(
+            f"Some selected {model._meta.verbose_name_plural} are no longer in stock."
+        )
 
 
 def _restore_stock(rental: Rental) -> None:
-    """Atomically restore ``available_quantity`` for every item in the rental."""
+    """
+    Atomically restore ``available_quantity`` for every item in the rental.
+
+    One UPDATE per item type (``WHERE id IN (<m2m subquery>)``), independent
+    of how many games / accessories the rental holds.
+    """
     if rental.console_id:
         Console.objects.filter(pk=rental.console_id).update(
             available_quantity=models.F("available_quantity") + 1,
         )
 
-    for game in rental.games.all():
-        Game.objects.filter(pk=game.pk).update(
-            available_quantity=models.F("available_quantity") + 1,
-        )
-
-    for acc in rental.accessories.all():
-        Accessory.objects.filter(pk=acc.pk).update(
-            available_quantity=models.F("available_quantity") + 1,
-        )
+    Game.objects.filter(rentals=rental).update(
+        available_quantity=models.F("available_quantity") + 1,
+    )
+    Accessory.objects.filter(rentals=rental).update(
+        available_quantity=models.F("available_quantity") + 1,
+    )
 
+    catalog_service.touch_catalog()
     logger.info("Stock restored for rental %s", rental.rental_number)
 
 
@@ -203,6 +232,10 @@ def calculate_late_fee(rental: Rental, *, return_date: date | None = None) -> De
 
     If ``return_date`` is supplied it is used; otherwise ``timezone.now().date()``
     is assumed.  Only days *past* ``rental_end_date`` count.
+
+    The result is memoised on the instance per return date, so callers
+    touching the same rental in one request (view, service, signals)
+    share the game/accessory COUNT queries.
     """
     effective_return = return_date or timezone.now().date()
 
@@ -210,6 +243,16 @@ def calculate_late_fee(rental: Rental, *, return_date: date | None = None) -> De
     if overdue_days <= 0:
         return Decimal("0.00")
 
+    # Annotated by ``with_late_fee_per_day`` — no COUNT queries needed.
+    per_day = rental.__dict__.get("late_fee_per_day")
+    if per_day is not None:
+        return per_day * overdue_days
+
+    cache = rental.__dict__.setdefault("_late_fee_cache", {})
+    key = (effective_return, rental.rental_end_date, rental.console_id)
+    if key in cache:
+        return cache[key]
+
     fee = Decimal("0.00")
 
     if rental.console_id:
@@ -218,9 +261,61 @@ def calculate_late_fee(rental: Rental, *, return_date: date | None = None) -> De
     fee += LATE_FEE_PER_DAY_GAME * rental.games.count() * overdue_days
     fee += LATE_FEE_PER_DAY_ACCESSORY * rental.accessories.count() * overdue_days
 
+    cache[key] = fee
     return fee
 
 
+_FEE_FIELD = models.DecimalField(max_digits=8, decimal_places=2)
+
+
+def _late_fee_per_day_expression() -> models.Expression:
+    """SQL equivalent of the per-day rate ``calculate_late_fee`` charges."""
+
+    def _item_count(through) -> Coalesce:
+        return Coalesce(
+            Subquery(
+                through.objects
+                .filter(rental_id=OuterRef("pk"))
+                .values("rental_id")
+                .annotate(cnt=Count("pk"))
+                .values("cnt")
+            ),
+            0,
+        )
+
+    return ExpressionWrapper(
+        Case(
+            When(console__isnull=False, then=Value(LATE_FEE_PER_DAY_CONSOLE)),
+            default=Value(Decimal("0.00")),
+            output_field=_FEE_FIELD,
+        )
+        + Value(LATE_FEE_PER_DAY_GAME) * _item_count(Rental.games.through)
+        + Value(LATE_FEE_PER_DAY_ACCESSORY) * _item_count(Rental.accessories.through),
+        output_field=_FEE_FIELD,
+    )
+
+
+def _late_fee_expression(overdue_days: int) -> ExpressionWrapper:
+    """
+    SQL equivalent of ``calculate_late_fee`` for a fixed ``overdue_days``,
+    usable inside ``QuerySet.update()``.
+    """
+    return ExpressionWrapper(
+        _late_fee_per_day_expression() * Value(overdue_days),
+        output_field=_FEE_FIELD,
+    )
+
+
+def with_late_fee_per_day(queryset: models.QuerySet) -> models.QuerySet:
+    """
+    Annotate each rental with its per-day late fee.
+
+    ``calculate_late_fee`` picks the annotation up, so previewing the fee
+    for a fetched rental costs no extra game/accessory COUNT queries.
+    """
+    return queryset.annotate(late_fee_per_day=_late_fee_per_day_expression())
+
+
 # ═══════════════════════════════════════════════════════════════════
 # RENTAL LIFECYCLE  (create → return → cancel)
 # ═══════════════════════════════════════════════════════════════════
@@ -278,7 +373,7 @@ def create_rental(
         rental_end_date=rental_end_date,
     )
 
-    rental_number = f"CC-{uuid.uuid4().hex[:8].upper()}"
+    rental_number = f"CC-{secrets.token_hex(4).upper()}"
 
     rental = Rental.objects.create(
         user=user,
@@ -335,10 +430,13 @@ def return_rental(rental: Rental, *, return_date: date | None = None) -> Rental:
     rental.actual_return_date = effective_return
     rental.late_fee = late_fee
     rental.status = RentalStatus.RETURNED
+    # A rental reviewed before an admin reopened it stays reviewed.
+    rental.is_reviewable = not Review.objects.filter(rental=rental).exists()
     rental.save(update_fields=[
         "actual_return_date",
         "late_fee",
         "status",
+        "is_reviewable",
         "updated_at",
     ])
 
@@ -406,3 +504,47 @@ def mark_rental_late(rental: Rental) -> Rental:
         "Rental %s marked late (₹%s fee)", rental.rental_number, rental.late_fee,
     )
     return rental
+
+
+@transaction.atomic
+def mark_overdue_rentals_late(*, today: date | None = None) -> int:
+    """
+    Bulk counterpart of ``mark_rental_late`` for the nightly Celery task.
+
+    Flips every ACTIVE rental past its end date to LATE and snapshots the
+    late fee in SQL.  Overdue days are constant for a given end date, so
+    this is one UPDATE per distinct ``rental_end_date`` (usually just
+    yesterday) instead of a SELECT + UPDATE + transaction per rental.
+
+    Returns the number of rentals marked late.
+    """
+    today = today or timezone.now().date()
+    overdue = Rental.objects.filter(
+        status=RentalStatus.ACTIVE,
+        rental_end_date__lt=today,
+    )
+
+    end_dates = (
+        overdue
+        .order_by("rental_end_date")
+        .values_list("rental_end_date", flat=True)
+        .distinct()
+    )
+
+    marked = 0
+    now = timezone.now()
+    for end_date in list(end_dates):
+        overdue_days = (today - end_date).days
+        updated = overdue.filter(rental_end_date=end_date).update(
+            status=RentalStatus.LATE,
+            late_fee=_late_fee_expression(overdue_days),
+            updated_at=now,
+        )
+        marked += updated
+        logger.info(
+            "%d rental(s) ending %s marked late (%d day(s) overdue)",
+            updated,
+            end_date,
+            overdue_days,
+        )
+    return marked
@@ -8,11 +8,15 @@ and only handle HTTP concerns.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
+from django.core.cache import cache
 from django.db import IntegrityError, models, transaction
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count, F, Q, Value
+from django.db.models.functions import Coalesce, NullIf
 
 if TYPE_CHECKING:
     from django.contrib.auth import get_user_model
@@ -23,6 +27,9 @@ from .models import Console, Rental, RentalStatus, Review
 
 logger = logging.getLogger(__name__)
 
+REVIEW_STATS_CACHE_TIMEOUT = 60 * 5  # seconds
+REVIEW_LIST_CACHE_TIMEOUT = 60 * 5  # seconds
+
 
 # ═══════════════════════════════════════════════════════════════════
 # VALIDATION  HELPERS
@@ -57,23 +64,6 @@ def _validate_rental_for_review(rental: Rental, user) -> None:
         )
 
 
-def _validate_no_duplicate(rental: Rental, exclude_review_id=None) -> None:
-    """
-    Guard: one review per rental (DB also enforces via UniqueConstraint).
-
-    ``exclude_review_id`` is used when *updating* an existing review so
-    the check doesn't flag the review being edited.
-    """
-    qs = Review.objects.filter(rental=rental)
-    if exclude_review_id:
-        qs = qs.exclude(id=exclude_review_id)
-    if qs.exists():
-        raise ReviewValidationError(
-            "A review already exists for this rental.",
-            code="duplicate_review",
-        )
-
-
 # ═══════════════════════════════════════════════════════════════════
 # CREATE
 # ═══════════════════════════════════════════════════════════════════
@@ -113,20 +103,22 @@ def create_review(
         If any business rule is violated.
     """
     _validate_rental_for_review(rental, user)
-    _validate_no_duplicate(rental)
 
+    # No pre-flight EXISTS query — the OneToOne on ``rental`` is the
+    # duplicate check.  The savepoint keeps the outer transaction usable.
     try:
-        review = Review.objects.create(
-            rental=rental,
-            user=user,
-            console=rental.console,  # nullable — None for game-only rentals
-            title=title,
-            rating=rating,
-            comment=comment,
-            is_verified=True,
-        )
+        with transaction.atomic():
+            review = Review.objects.create(
+                rental=rental,
+                user=user,
+                console_id=rental.console_id,  # nullable — None for game-only rentals
+                title=title,
+                rating=rating,
+                comment=comment,
+                is_verified=True,
+            )
     except IntegrityError:
-        # Race condition — the UniqueConstraint caught a concurrent insert
+        # Existing or concurrent review — the unique rental constraint fired
         raise ReviewValidationError(
             "A review already exists for this rental.",
             code="duplicate_review",
@@ -216,10 +208,42 @@ def delete_review(*, review: Review, user) -> None:
 # AGGREGATE STATS
 # ═══════════════════════════════════════════════════════════════════
 
+def _review_stats_cache_key(console_id) -> str:
+    return f"rev:stats:{console_id}"
+
+
+def _review_list_version_key(console_id) -> str:
+    return f"rev:list:ver:{console_id}"
+
+
+def invalidate_console_reviews(console_id) -> None:
+    """
+    Drop a console's cached stats and review pages once the current
+    transaction commits.
+
+    Review pages are keyed by cursor, so rather than deleting them by
+    pattern (a Redis-only ``SCAN``) the console's list version is bumped
+    and stale pages simply age out.
+    """
+    if console_id is None:
+        return
+    stats_key = _review_stats_cache_key(console_id)
+    version_key = _review_list_version_key(console_id)
+
+    def _invalidate():
+        cache.delete(stats_key)
+        cache.set(version_key, time.time_ns(), timeout=None)
+
+    transaction.on_commit(_invalidate)
+
+
 def get_console_review_stats(console: Console) -> dict[str, Any]:
     """
     Return aggregate review statistics for a console.
 
+    Cached for ``REVIEW_STATS_CACHE_TIMEOUT`` seconds; review saves and
+    deletes invalidate the entry (see ``signals``).
+
     Returns
     -------
     dict with keys:
@@ -227,28 +251,26 @@ def get_console_review_stats(console: Console) -> dict[str, Any]:
         total_reviews   – int
         rating_breakdown – {1: count, 2: count, …, 5: count}
     """
-    qs = Review.objects.filter(console=console, is_verified=True)
+    return cache.get_or_set(
+        _review_stats_cache_key(console.pk),
+        lambda: _compute_console_review_stats(console),
+        REVIEW_STATS_CACHE_TIMEOUT,
+    )
+
 
-    agg = qs.aggregate(
+def _compute_console_review_stats(console: Console) -> dict[str, Any]:
+    # Average, total and the per-star breakdown in a single aggregate.
+    agg = Review.objects.filter(console=console, is_verified=True).aggregate(
         average_rating=Avg("rating"),
         total_reviews=Count("id"),
+        **{f"rating_{i}": Count("id", filter=Q(rating=i)) for i in range(1, 6)},
     )
 
-    # Rating breakdown in one query
-    breakdown_qs = (
-        qs.values("rating")
-        .annotate(count=Count("id"))
-        .order_by("rating")
-    )
-    breakdown = {i: 0 for i in range(1, 6)}
-    for row in breakdown_qs:
-        breakdown[row["rating"]] = row["count"]
-
     avg = agg["average_rating"]
     return {
         "average_rating": round(avg, 1) if avg is not None else None,
         "total_reviews": agg["total_reviews"],
-        "rating_breakdown": breakdown,
+        "rating_breakdown": {i: agg[f"rating_{i}"] for i in range(1, 6)},
     }
 
 
@@ -256,11 +278,121 @@ def get_reviewable_rentals(user) -> models.QuerySet:
     """
     Return rentals that the user can still review (RETURNED + no review yet).
     Useful for a "Write a review" prompt on the frontend.
+
+    Rows are plain dicts (``console`` is the console id), shaped for
+    ``ReviewableRentalSerializer`` — no model instances are built.
+    Reads the denormalised ``is_reviewable`` flag instead of anti-joining
+    ``Review``; the status check guards against a stale flag.
     """
     return (
         Rental.objects
-        .filter(user=user, status=RentalStatus.RETURNED)
-        .exclude(review__isnull=False)
-        .select_related("console")
+        .filter(user=user, is_reviewable=True, status=RentalStatus.RETURNED)
         .order_by("-actual_return_date")
+        .values(
+            "id",
+            "rental_number",
+            "console",
+            "rental_start_date",
+            "rental_end_date",
+            "actual_return_date",
+            console_name=F("console__name"),
+        )
+    )
+
+
+def set_rental_reviewable(rental_id, *, reviewable: bool) -> None:
+    """
+    Keep ``Rental.is_reviewable`` in step with the rental's review.
+
+    Only a returned rental can become reviewable again.
+    """
+    qs = Rental.objects.filter(pk=rental_id)
+    if reviewable:
+        qs = qs.filter(status=RentalStatus.RETURNED)
+    qs.update(is_reviewable=reviewable)
+
+
+def review_list_rows(queryset: models.QuerySet) -> models.QuerySet:
+    """
+    Project a ``Review`` queryset onto the flat dict rows
+    ``ReviewListSerializer`` renders.
+
+    ``rental`` / ``console`` are ids; ``user_name`` mirrors
+    ``User.get_full_name()`` (full name, else email).
+    """
+    return queryset.values(
+        "id",
+        "rental",
+        "console",
+        "title",
+        "rating",
+        "comment",
+        "is_verified",
+        "helpful_count",
+        "created_at",
+        console_name=F("console__name"),
+        user_name=Coalesce(NullIf(F("user__full_name"), Value("")), F("user__email")),
+    )
+
+
+def iter_review_rows(queryset: models.QuerySet, batch_size: int = 500):
+    """
+    Yield ``review_list_rows`` for ``queryset``, newest first.
+
+    Rows are read in keyset batches — each a ``LIMIT`` query seeking past
+    the last ``(created_at, id)`` — so memory stays bounded even where
+    server-side cursors are disabled (PgBouncer transaction pooling).
+    """
+    queryset = review_list_rows(queryset.order_by("-created_at", "-id"))
+    batch = list(queryset[:batch_size])
+    while batch:
+        yield from batch
+        if len(batch) < batch_size:
+            return
+        last = batch[-1]
+        batch = list(
+            queryset.filter(
+                Q(created_at__lt=last["created_at"])
+                | Q(created_at=last["created_at"], id__lt=last["id"])
+            )[:batch_size]
+        )
+
+
+def list_console_reviews(console: Console) -> models.QuerySet:
+    """Return the review rows shown on a console page, newest first."""
+    return review_list_rows(
+        Review.objects.filter(console=console).order_by("-created_at")
+    )
+
+
+def get_console_reviews_version(console_id) -> int:
+    """
+    Return a nanosecond token that changes whenever one of the console's
+    reviews does (see ``invalidate_console_reviews``).
+    """
+    return cache.get_or_set(
+        _review_list_version_key(console_id), time.time_ns, timeout=None,
+    )
+
+
+def get_cached_console_reviews(
+    console: Console, page_url: str, build, version: int | None = None,
+) -> Any:
+    """
+    Return the cached review payload for one page of a console's reviews.
+
+    ``page_url`` is the full request URL (cursor and page size included,
+    and the host the pagination links are built from); ``build`` is
+    called to produce the payload on a miss.  Entries live for
+    ``REVIEW_LIST_CACHE_TIMEOUT`` seconds and are superseded as soon as
+    any of the console's reviews change (``version`` is looked up if not
+    given).
+    """
+    if version is None:
+        version = get_console_reviews_version(console.pk)
+    digest = hashlib.md5(page_url.encode()).hexdigest()
+    return cache.get_or_set(
+        f"rev:list:{console.pk}:{version}:{digest}",
+        build,
+        REVIEW_LIST_CACHE_TIMEOUT,
     )
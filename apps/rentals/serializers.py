@@ -1,6 +1,13 @@
 from django.db import models
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
 
+from apps.core.serializers import (
+    BulkPrimaryKeyRelatedField,
+    CachedFieldsMixin,
+    CompiledRepresentationMixin,
+)
+
 from .models import (
     Accessory,
     Console,
@@ -23,7 +30,7 @@ class ConsoleImageSerializer(serializers.ModelSerializer):
         fields = ["id", "image", "alt_text", "is_primary", "order"]
 
 
-class ConsoleListSerializer(serializers.ModelSerializer):
+class ConsoleListSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     console_type_display = serializers.CharField(source="get_console_type_display", read_only=True)
     condition_display = serializers.CharField(source="get_condition_status_display", read_only=True)
     is_in_stock = serializers.BooleanField(read_only=True)
@@ -50,9 +57,22 @@ class ConsoleListSerializer(serializers.ModelSerializer):
         ]
 
     def get_primary_image(self, obj):
-        primary = obj.images.filter(is_primary=True).first()
+        # ``primary_images`` comes from a filtered Prefetch on the console
+        # viewset; consoles loaded elsewhere fall back to a query.
+        if hasattr(obj, "primary_images"):
+            primary = obj.primary_images[0] if obj.primary_images else None
+        else:
+            primary = obj.images.filter(is_primary=True).first()
         if primary:
-            return ConsoleImageSerializer(primary).data
+            # Built by hand — a nested ConsoleImageSerializer per row re-runs
+            # DRF's field binding for a fixed five-key shape.
+            return {
+                "id": str(primary.id),
+                "image": primary.image.url if primary.image else None,
+                "alt_text": primary.alt_text,
+                "is_primary": primary.is_primary,
+                "order": primary.order,
+            }
         if obj.image:
             return {"image": obj.image.url}
         return None
@@ -91,13 +111,18 @@ class ConsoleDetailSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
+    # ``avg_rating`` / ``review_count`` are annotated by the console
+    # viewset; consoles loaded elsewhere fall back to a query.
     def get_average_rating(self, obj):
-        reviews = obj.reviews.all()
-        if reviews.exists():
-            return round(reviews.aggregate(avg=models.Avg("rating"))["avg"], 1)
-        return None
+        if hasattr(obj, "avg_rating"):
+            avg = obj.avg_rating
+        else:
+            avg = obj.reviews.aggregate(avg=models.Avg("rating"))["avg"]
+        return round(avg, 1) if avg is not None else None
 
     def get_review_count(self, obj):
+        if hasattr(obj, "review_count"):
+            return obj.review_count
         return obj.reviews.count()
 
 
@@ -105,7 +130,7 @@ class ConsoleDetailSerializer(serializers.ModelSerializer):
 # GAME
 # ═══════════════════════════════════════════════════════════════════
 
-class GameListSerializer(serializers.ModelSerializer):
+class GameListSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     platform_display = serializers.CharField(source="get_platform_display", read_only=True)
     genre_display = serializers.CharField(source="get_genre_display", read_only=True)
     is_in_stock = serializers.BooleanField(read_only=True)
@@ -161,7 +186,7 @@ class GameDetailSerializer(serializers.ModelSerializer):
 # ACCESSORY
 # ═══════════════════════════════════════════════════════════════════
 
-class AccessorySerializer(serializers.ModelSerializer):
+class AccessorySerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     category_display = serializers.CharField(source="get_category_display", read_only=True)
     compatible_with_display = serializers.CharField(source="get_compatible_with_display", read_only=True)
     is_in_stock = serializers.BooleanField(read_only=True)
@@ -201,12 +226,12 @@ class RentalCreateSerializer(serializers.Serializer):
         required=False,
         allow_null=True,
     )
-    game_ids = serializers.PrimaryKeyRelatedField(
+    game_ids = BulkPrimaryKeyRelatedField(
         queryset=Game.objects.filter(is_active=True),
         many=True,
         required=False,
     )
-    accessory_ids = serializers.PrimaryKeyRelatedField(
+    accessory_ids = BulkPrimaryKeyRelatedField(
         queryset=Accessory.objects.filter(is_active=True),
         many=True,
         required=False,
@@ -272,8 +297,10 @@ class RentalCreateSerializer(serializers.Serializer):
         return data
 
 
-class RentalListSerializer(serializers.ModelSerializer):
-    console_name = serializers.CharField(source="console.name", read_only=True, default=None)
+class RentalListSerializer(
+    CachedFieldsMixin, CompiledRepresentationMixin, serializers.ModelSerializer
+):
+    console_name = serializers.CharField(source="console.name", read_only=True, allow_null=True)
     duration_days = serializers.IntegerField(read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
     rental_type_display = serializers.CharField(source="get_rental_type_display", read_only=True)
@@ -305,6 +332,39 @@ class RentalListSerializer(serializers.ModelSerializer):
         ]
 
 
+# Columns ``RentalListSerializer`` reads, for ``.only()`` on list querysets
+# (skips the delivery text fields and the joined console's description).
+RENTAL_LIST_COLUMNS = (
+    "id",
+    "rental_number",
+    "console",
+    "console__name",
+    "rental_type",
+    "status",
+    "rental_start_date",
+    "rental_end_date",
+    "total_price",
+    "deposit_amount",
+    "late_fee",
+    "delivery_option",
+    "payment_status",
+    "created_at",
+)
+
+
+class RentalDetailListSerializer(serializers.ListSerializer):
+    """
+    Resolve ``games`` / ``accessories`` for every rental in one query each,
+    however the caller built the queryset — avoids 2N lazy lookups.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        rentals = list(iterable)
+        prefetch_related_objects(rentals, "games", "accessories")
+        return super().to_representation(rentals)
+
+
 class RentalDetailSerializer(serializers.ModelSerializer):
     console = ConsoleListSerializer(read_only=True)
     games = GameListSerializer(many=True, read_only=True)
@@ -319,6 +379,7 @@ class RentalDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Rental
+        list_serializer_class = RentalDetailListSerializer
         fields = [
             "id",
             "rental_number",
@@ -401,30 +462,24 @@ class ReviewUpdateSerializer(serializers.Serializer):
     )
 
 
-class ReviewListSerializer(serializers.ModelSerializer):
-    """Compact output for review listings (e.g. console detail page)."""
-
-    user_name = serializers.CharField(source="user.get_full_name", read_only=True)
-    console_name = serializers.SerializerMethodField()
+class ReviewListSerializer(serializers.Serializer):
+    """
+    Compact output for review listings (e.g. console detail page).
 
-    class Meta:
-        model = Review
-        fields = [
-            "id",
-            "rental",
-            "console",
-            "console_name",
-            "title",
-            "rating",
-            "comment",
-            "is_verified",
-            "helpful_count",
-            "user_name",
-            "created_at",
-        ]
+    Reads the ``values()`` rows from ``review_service.review_list_rows``.
+    """
 
-    def get_console_name(self, obj):
-        return obj.console.name if obj.console else None
+    id = serializers.UUIDField(read_only=True)
+    rental = serializers.UUIDField(read_only=True)
+    console = serializers.UUIDField(read_only=True, allow_null=True)
+    console_name = serializers.CharField(read_only=True, allow_null=True)
+    title = serializers.CharField(read_only=True)
+    rating = serializers.IntegerField(read_only=True)
+    comment = serializers.CharField(read_only=True)
+    is_verified = serializers.BooleanField(read_only=True)
+    helpful_count = serializers.IntegerField(read_only=True)
+    user_name = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
 
 
 class ReviewDetailSerializer(serializers.ModelSerializer):
@@ -468,25 +523,20 @@ class ReviewStatsSerializer(serializers.Serializer):
     )
 
 
-class ReviewableRentalSerializer(serializers.ModelSerializer):
-    """Compact rental info for the 'reviewable rentals' endpoint."""
-
-    console_name = serializers.SerializerMethodField()
+class ReviewableRentalSerializer(serializers.Serializer):
+    """
+    Compact rental info for the 'reviewable rentals' endpoint.
 
-    class Meta:
-        model = Rental
-        fields = [
-            "id",
-            "rental_number",
-            "console",
-            "console_name",
-            "rental_start_date",
-            "rental_end_date",
-            "actual_return_date",
-        ]
+    Reads the ``values()`` rows from ``review_service.get_reviewable_rentals``.
+    """
 
-    def get_console_name(self, obj):
-        return obj.console.name if obj.console else None
+    id = serializers.UUIDField(read_only=True)
+    rental_number = serializers.CharField(read_only=True)
+    console = serializers.UUIDField(read_only=True, allow_null=True)
+    console_name = serializers.CharField(read_only=True, allow_null=True)
+    rental_start_date = serializers.DateField(read_only=True)
+    rental_end_date = serializers.DateField(read_only=True)
+    actual_return_date = serializers.DateField(read_only=True, allow_null=True)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -507,13 +557,13 @@ class AvailabilityCheckSerializer(serializers.Serializer):
         allow_null=True,
         help_text="Console to check.",
     )
-    game_ids = serializers.PrimaryKeyRelatedField(
+    game_ids = BulkPrimaryKeyRelatedField(
         queryset=Game.objects.filter(is_active=True),
         many=True,
         required=False,
         help_text="Games to check.",
     )
-    accessory_ids = serializers.PrimaryKeyRelatedField(
+    accessory_ids = BulkPrimaryKeyRelatedField(
         queryset=Accessory.objects.filter(is_active=True),
         many=True,
         required=False,
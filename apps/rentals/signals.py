@@ -7,34 +7,69 @@ Heavy logic (price calc, stock, late fees) lives in ``rental_service.py``.
 
 import logging
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import Rental, RentalStatus
+from .models import Accessory, Console, ConsoleImage, Game, Rental, RentalStatus, Review
 
 logger = logging.getLogger(__name__)
 
 
-@receiver(pre_save, sender=Rental)
-def track_status_change(sender, instance, **kwargs):
+_RETURNABLE_STATUSES = (
+    RentalStatus.ACTIVE,
+    RentalStatus.LATE,
+    RentalStatus.OVERDUE,
+)
+
+
+@receiver(pre_save, sender=Rental, dispatch_uid="rentals.track_status_change")
+def track_status_change(sender, instance, update_fields=None, **kwargs):
     """
     Stash the *previous* status on the instance so ``post_save`` can
     detect a real transition (avoids duplicate stock restores).
+
+    ``Rental.from_db`` already records the status the row was loaded
+    with, so only instances loaded with ``status`` deferred fall back to
+    a query.
+
+    An admin-driven return also gets its late fee computed here, so the
+    fee is written by the same UPDATE as the status change.
     """
-    if instance.pk:
-        try:
-            instance._prev_status = (
-                Rental.objects.filter(pk=instance.pk)
-                .values_list("status", flat=True)
-                .first()
-            )
-        except Rental.DoesNotExist:
-            instance._prev_status = None
-    else:
+    from . import rental_service  # late import to avoid circular
+
+    if instance._state.adding:
         instance._prev_status = None
+    elif "_prev_status" not in instance.__dict__:
+        instance._prev_status = (
+            Rental.objects.filter(pk=instance.pk)
+            .values_list("status", flat=True)
+            .first()
+        )
+
+    # ── Returned via admin (service.return_rental handles its own) ──
+    instance._late_fee_pending = False
+    if (
+        instance.status == RentalStatus.RETURNED
+        and instance._prev_status in _RETURNABLE_STATUSES
+        and instance.late_fee == 0
+        and instance.actual_return_date
+    ):
+        instance.late_fee = rental_service.calculate_late_fee(
+            instance, return_date=instance.actual_return_date,
+        )
+        # A save restricted to other columns won't persist the fee;
+        # post_save writes it separately in that case.
+        instance._late_fee_pending = (
+            update_fields is not None and "late_fee" not in update_fields
+        )
+        logger.info(
+            "Signal: late fee ₹%s applied to %s",
+            instance.late_fee,
+            instance.rental_number,
+        )
 
 
-@receiver(post_save, sender=Rental)
+@receiver(post_save, sender=Rental, dispatch_uid="rentals.handle_status_transition")
 def handle_status_transition(sender, instance, created, **kwargs):
     """
     React to status transitions that the service layer did *not* handle
@@ -44,32 +79,31 @@ def handle_status_transition(sender, instance, created, **kwargs):
     the stock is already correct — but admin-driven changes also need
     stock correction.
     """
-    from . import rental_service  # late import to avoid circular
-
     prev = getattr(instance, "_prev_status", None)
     curr = instance.status
+    # The saved status is the baseline for the next save of this instance.
+    instance._prev_status = curr
 
     # No actual change → nothing to do
     if prev == curr:
         return
 
-    # ── Returned via admin (service.return_rental handles its own) ──
-    if curr == RentalStatus.RETURNED and prev in (
-        RentalStatus.ACTIVE,
-        RentalStatus.LATE,
-        RentalStatus.OVERDUE,
-    ):
-        # Only compute late fee if it wasn't already set
-        if instance.late_fee == 0 and instance.actual_return_date:
-            instance.late_fee = rental_service.calculate_late_fee(
-                instance, return_date=instance.actual_return_date,
-            )
-            Rental.objects.filter(pk=instance.pk).update(late_fee=instance.late_fee)
-            logger.info(
-                "Signal: late fee ₹%s applied to %s",
-                instance.late_fee,
-                instance.rental_number,
-            )
+    if getattr(instance, "_late_fee_pending", False):
+        Rental.objects.filter(pk=instance.pk).update(late_fee=instance.late_fee)
+        instance._late_fee_pending = False
+
+    # ── Returned via admin: open it up for a review ────────────────
+    # Unless it already has one (e.g. moved back to RETURNED by hand).
+    if curr == RentalStatus.RETURNED and not instance.is_reviewable:
+        instance.is_reviewable = bool(
+            Rental.objects
+            .filter(pk=instance.pk, review__isnull=True)
+            .update(is_reviewable=True)
+        )
+    # ── Moved off RETURNED via admin: no longer reviewable ────────
+    elif prev == RentalStatus.RETURNED and instance.is_reviewable:
+        Rental.objects.filter(pk=instance.pk).update(is_reviewable=False)
+        instance.is_reviewable = False
 
     # ── Cancelled via admin ─────────────────────────────────────────
     # (service.cancel_rental already restores stock, but admin changes
@@ -85,3 +119,73 @@ def handle_status_transition(sender, instance, created, **kwargs):
     logger.debug(
         "Rental %s status: %s → %s", instance.rental_number, prev, curr,
     )
+
+
+@receiver(post_save, sender=Rental, dispatch_uid="rentals.invalidate_availability_on_save")
+@receiver(post_delete, sender=Rental, dispatch_uid="rentals.invalidate_availability_on_delete")
+def invalidate_console_availability(sender, instance, **kwargs):
+    """Any rental write may change its console's blocking intervals."""
+    from . import availability_service  # late import to avoid circular
+
+    availability_service.invalidate_console_intervals(instance.console_id)
+    availability_service.invalidate_availability()
+
+
+@receiver(
+    m2m_changed, sender=Rental.games.through,
+    dispatch_uid="rentals.invalidate_availability_on_games",
+)
+@receiver(
+    m2m_changed, sender=Rental.accessories.through,
+    dispatch_uid="rentals.invalidate_availability_on_accessories",
+)
+def invalidate_cart_availability(sender, action, **kwargs):
+    """Games / accessories attached to a rental change cart overlap counts."""
+    from . import availability_service  # late import to avoid circular
+
+    if action in ("post_add", "post_remove", "post_clear"):
+        availability_service.invalidate_availability()
+
+
+@receiver(post_save, sender=Review, dispatch_uid="rentals.invalidate_reviews_on_save")
+@receiver(post_delete, sender=Review, dispatch_uid="rentals.invalidate_reviews_on_delete")
+def invalidate_console_reviews(sender, instance, **kwargs):
+    """Review writes stale the console's cached review pages and stats."""
+    from . import review_service  # late import to avoid circular
+
+    review_service.invalidate_console_reviews(instance.console_id)
+
+
+@receiver(post_save, sender=Review, dispatch_uid="rentals.close_reviewable_on_save")
+def close_reviewable_rental(sender, instance, created, **kwargs):
+    """A reviewed rental drops out of the "write a review" list."""
+    from . import review_service  # late import to avoid circular
+
+    if created:
+        review_service.set_rental_reviewable(instance.rental_id, reviewable=False)
+
+
+@receiver(post_delete, sender=Review, dispatch_uid="rentals.reopen_reviewable_on_delete")
+def reopen_reviewable_rental(sender, instance, **kwargs):
+    """Deleting a review makes its returned rental reviewable again."""
+    from . import review_service  # late import to avoid circular
+
+    review_service.set_rental_reviewable(instance.rental_id, reviewable=True)
+
+
+def touch_catalog(sender, **kwargs):
+    """Catalog rows (and the review stats on console pages) changed."""
+    from . import catalog_service  # late import to avoid circular
+
+    catalog_service.touch_catalog()
+
+
+for _model in (Console, ConsoleImage, Game, Accessory, Review):
+    post_save.connect(
+        touch_catalog, sender=_model,
+        dispatch_uid=f"rentals.touch_catalog_on_save.{_model.__name__}",
+    )
+    post_delete.connect(
+        touch_catalog, sender=_model,
+        dispatch_uid=f"rentals.touch_catalog_on_delete.{_model.__name__}",
+    )
@@ -9,29 +9,48 @@ Periodic tasks
    → Marks all ACTIVE rentals past their end date as LATE (runs at midnight).
 3. ``auto_refund_deposits``
    → Automatically refunds the security deposit for rentals returned on time
-     (no late fee, deposit payment completed).
+     (no late fee, deposit payment completed).  Each refund runs as its own
+     ``refund_deposit`` task.
 """
 
 import logging
 from datetime import timedelta
+from functools import lru_cache
 
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.db import transaction
-from django.template.loader import render_to_string
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
 from django.utils import timezone
 from django.utils.html import strip_tags
 
 logger = logging.getLogger(__name__)
 
+# Settings read by every reminder email, resolved once at import.
+_FROM_EMAIL = settings.DEFAULT_FROM_EMAIL
+_SITE_URL = getattr(settings, "SITE_URL", "http://localhost:8000")
+_FRONTEND_URL = getattr(settings, "FRONTEND_URL", "http://localhost:3000")
+
 
 # ═══════════════════════════════════════════════════════════════════
 # 1. SEND RENTAL-END REMINDERS
 # ═══════════════════════════════════════════════════════════════════
 
+# Columns the reminder email actually reads.
+_REMINDER_FIELDS = (
+    "rental_number",
+    "rental_end_date",
+    "user__email",
+    "user__full_name",
+    "console__name",
+)
+
+
 @shared_task(
     name="apps.rentals.tasks.send_rental_end_reminders",
+    ignore_result=True,
     bind=True,
     max_retries=3,
     default_retry_delay=60 * 5,  # 5 minutes
@@ -55,33 +74,37 @@ def send_rental_end_reminders(self):
             rental_end_date=tomorrow,
         )
         .select_related("user", "console")
+        .only(*_REMINDER_FIELDS)
     )
 
     sent_count = 0
     failed_count = 0
 
-    for rental in rentals:
-        try:
-            _send_reminder_email(rental)
-            sent_count += 1
-            logger.info(
-                "Reminder sent for Rental #%s to %s",
-                rental.rental_number,
-                rental.user.email,
-            )
-        except Exception as exc:
-            failed_count += 1
-            logger.error(
-                "Failed to send reminder for Rental #%s: %s",
-                rental.rental_number,
-                exc,
-            )
+    # One SMTP session for the whole batch instead of a handshake per
+    # email; rows are streamed in chunks to keep worker memory bounded.
+    with get_connection() as connection:
+        for rental in rentals.iterator(chunk_size=500):
+            try:
+                _send_reminder_email(rental, connection=connection)
+                sent_count += 1
+                logger.info(
+                    "Reminder sent for Rental #%s to %s",
+                    rental.rental_number,
+                    rental.user.email,
+                )
+            except Exception as exc:
+                failed_count += 1
+                logger.error(
+                    "Failed to send reminder for Rental #%s: %s",
+                    rental.rental_number,
+                    exc,
+                )
 
     logger.info(
         "Rental reminders: %d sent, %d failed out of %d total.",
         sent_count,
         failed_count,
-        rentals.count(),
+        sent_count + failed_count,
     )
     return {
         "sent": sent_count,
@@ -90,8 +113,26 @@ def send_rental_end_reminders(self):
     }
 
 
-def _send_reminder_email(rental):
-    """Build and dispatch the rental-ending-soon email."""
+@lru_cache(maxsize=None)
+def _email_template(template_name):
+    """
+    Resolve an email template once per worker process.
+
+    Returns ``None`` when the template is missing; the miss is cached
+    too, so the loader isn't walked again for every email.
+    """
+    try:
+        return get_template(template_name)
+    except TemplateDoesNotExist:
+        return None
+
+
+def _send_reminder_email(rental, connection=None):
+    """
+    Build and dispatch the rental-ending-soon email.
+
+    Pass an open ``connection`` to reuse it across several reminders.
+    """
     subject = f"⏰ Reminder: Your rental #{rental.rental_number} ends tomorrow!"
 
     # Try HTML template first; fall back to plain text.
@@ -101,16 +142,20 @@ def _send_reminder_email(rental):
         "console_name": rental.console.name if rental.console else "N/A",
         "end_date": rental.rental_end_date,
         "rental_number": rental.rental_number,
-        "site_url": getattr(settings, "SITE_URL", "http://localhost:8000"),
-        "frontend_url": getattr(settings, "FRONTEND_URL", "http://localhost:3000"),
+        "site_url": _SITE_URL,
+        "frontend_url": _FRONTEND_URL,
     }
 
-    try:
-        html_message = render_to_string(
-            "emails/rental_end_reminder.html", context
+    html_template = _email_template("emails/rental_end_reminder.html")
+    text_template = _email_template("emails/rental_end_reminder.txt")
+    if html_template is not None:
+        html_message = html_template.render(context)
+        plain_message = (
+            text_template.render(context)
+            if text_template is not None
+            else strip_tags(html_message)
         )
-        plain_message = strip_tags(html_message)
-    except Exception:
+    else:
         # Template not found — use inline plain text.
         plain_message = (
             f"Hi {rental.user.full_name or rental.user.email},\n\n"
@@ -126,14 +171,16 @@ def _send_reminder_email(rental):
         )
         html_message = None
 
-    send_mail(
+    message = EmailMultiAlternatives(
         subject=subject,
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[rental.user.email],
-        html_message=html_message,
-        fail_silently=False,
+        body=plain_message,
+        from_email=_FROM_EMAIL,
+        to=[rental.user.email],
+        connection=connection,
     )
+    if html_message:
+        message.attach_alternative(html_message, "text/html")
+    message.send(fail_silently=False)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -142,6 +189,7 @@ def _send_reminder_email(rental):
 
 @shared_task(
     name="apps.rentals.tasks.auto_mark_late_rentals",
+    ignore_result=True,
     bind=True,
     max_retries=3,
     default_retry_delay=60 * 5,
@@ -152,52 +200,17 @@ def auto_mark_late_rentals(self):
     """
     Find every ACTIVE rental whose end date has passed and mark it LATE.
 
-    Runs daily at 00:05 via Celery Beat.  Uses the existing
-    ``rental_service.mark_rental_late()`` so all business logic
-    (status transition, late-fee snapshot) stays in one place.
+    Runs daily at 00:05 via Celery Beat.  Delegates to
+    ``rental_service.mark_overdue_rentals_late()``, which flips the status
+    and snapshots the late fee with bulk UPDATEs — business logic stays
+    in the service layer, without a transaction per rental.
     """
-    from apps.rentals.models import Rental, RentalStatus
-    from apps.rentals.rental_service import RentalService
-
-    today = timezone.now().date()
+    from apps.rentals import rental_service
 
-    overdue_rentals = (
-        Rental.objects
-        .filter(
-            status=RentalStatus.ACTIVE,
-            rental_end_date__lt=today,
-        )
-        .select_related("user", "console")
-    )
-
-    marked = 0
-    errors = 0
-
-    for rental in overdue_rentals:
-        try:
-            with transaction.atomic():
-                RentalService.mark_rental_late(rental)
-            marked += 1
-            logger.info(
-                "Rental #%s marked LATE (%d day(s) overdue).",
-                rental.rental_number,
-                rental.overdue_days,
-            )
-        except Exception as exc:
-            errors += 1
-            logger.error(
-                "Could not mark Rental #%s as late: %s",
-                rental.rental_number,
-                exc,
-            )
+    marked = rental_service.mark_overdue_rentals_late()
 
-    logger.info(
-        "Auto-mark-late: %d marked, %d errors out of %d overdue.",
-        marked,
-        errors,
-        overdue_rentals.count(),
-    )
-    return {"marked": marked, "errors": errors}
+    logger.info("Auto-mark-late: %d rental(s) marked LATE.", marked)
+    return {"marked": marked}
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -206,6 +219,7 @@ def auto_mark_late_rentals(self):
 
 @shared_task(
     name="apps.rentals.tasks.auto_refund_deposits",
+    ignore_result=True,
     bind=True,
     max_retries=3,
     default_retry_delay=60 * 10,  # 10 minutes (Stripe calls)
@@ -223,70 +237,81 @@ def auto_refund_deposits(self):
     * A related Payment with type=DEPOSIT and status=COMPLETED exists
     * The deposit payment hasn't already been refunded
 
-    Runs daily at 10:00 via Celery Beat.
+    Runs daily at 10:00 via Celery Beat.  Each eligible deposit is
+    handed to ``refund_deposit`` so the Stripe calls run in parallel
+    across the worker pool instead of serially in this task.
     """
     from apps.payments.models import Payment, PaymentStatus, PaymentType
-    from apps.payments.services import StripeService
-    from apps.rentals.models import Rental, RentalStatus
+    from apps.rentals.models import RentalStatus
 
-    returned_rentals = (
-        Rental.objects
+    # One query: eligibility (rental state + refundable deposit) is
+    # resolved in SQL rather than per rental in Python.
+    payment_ids = (
+        Payment.objects
         .filter(
-            status=RentalStatus.RETURNED,
-            late_fee=0,
+            payment_type=PaymentType.DEPOSIT,
+            status=PaymentStatus.COMPLETED,
+            rental__status=RentalStatus.RETURNED,
+            rental__late_fee=0,
         )
-        .prefetch_related("payments")
+        .exclude(transaction_id="")
+        .values_list("pk", flat=True)
     )
 
-    refunded = 0
-    skipped = 0
-    errors = 0
+    queued = 0
+    for payment_id in payment_ids.iterator(chunk_size=500):
+        refund_deposit.delay(str(payment_id))
+        queued += 1
 
-    for rental in returned_rentals:
-        deposit_payment = (
-            rental.payments
-            .filter(
-                payment_type=PaymentType.DEPOSIT,
-                status=PaymentStatus.COMPLETED,
-            )
-            .first()
-        )
+    logger.info("Auto-refund deposits: %d refund(s) queued.", queued)
+    return {"queued": queued}
 
-        if not deposit_payment:
-            skipped += 1
-            continue
 
+@shared_task(
+    name="apps.rentals.tasks.refund_deposit",
+    ignore_result=True,
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60 * 10,  # 10 minutes (Stripe calls)
+    autoretry_for=(Exception,),
+    acks_late=True,
+    rate_limit="12/s",  # stay well under Stripe's API rate limit
+)
+def refund_deposit(self, payment_id: str):
+    """
+    Refund a single deposit payment queued by ``auto_refund_deposits``.
+
+    The payment row is locked and re-checked first, so a duplicate or
+    retried message never refunds the same deposit twice.
+    """
+    from apps.payments.models import Payment
+    from apps.payments.services import StripeService
+
+    with transaction.atomic():
+        deposit_payment = (
+            Payment.objects
+            .select_for_update()
+            .select_related("rental")
+            .get(pk=payment_id)
+        )
         if not deposit_payment.is_refundable:
-            skipped += 1
-            continue
-
-        try:
-            with transaction.atomic():
-                StripeService.process_refund(
-                    payment=deposit_payment,
-                    reason="requested_by_customer",
-                )
-            refunded += 1
             logger.info(
-                "Deposit ₹%s refunded for Rental #%s.",
-                deposit_payment.amount,
-                rental.rental_number,
-            )
-        except Exception as exc:
-            errors += 1
-            logger.error(
-                "Deposit refund failed for Rental #%s: %s",
-                rental.rental_number,
-                exc,
+                "Deposit for Rental #%s already refunded; skipping.",
+                deposit_payment.rental.rental_number,
             )
+            return {"payment_id": payment_id, "refunded": False}
+
+        StripeService.process_refund(
+            payment=deposit_payment,
+            reason="requested_by_customer",
+        )
 
     logger.info(
-        "Auto-refund deposits: %d refunded, %d skipped, %d errors.",
-        refunded,
-        skipped,
-        errors,
+        "Deposit ₹%s refunded for Rental #%s.",
+        deposit_payment.amount,
+        deposit_payment.rental.rental_number,
     )
-    return {"refunded": refunded, "skipped": skipped, "errors": errors}
+    return {"payment_id": payment_id, "refunded": True}
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -295,6 +320,7 @@ def auto_refund_deposits(self):
 
 @shared_task(
     name="apps.rentals.tasks.send_single_rental_reminder",
+    ignore_result=True,
     max_retries=3,
     default_retry_delay=60,
     autoretry_for=(Exception,),
@@ -311,7 +337,12 @@ def send_single_rental_reminder(rental_id: int):
     """
     from apps.rentals.models import Rental
 
-    rental = Rental.objects.select_related("user", "console").get(pk=rental_id)
+    rental = (
+        Rental.objects
+        .select_related("user", "console")
+        .only(*_REMINDER_FIELDS)
+        .get(pk=rental_id)
+    )
     _send_reminder_email(rental)
     logger.info("Ad-hoc reminder sent for Rental #%s.", rental.rental_number)
     return {"rental_number": rental.rental_number, "sent": True}
@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from rest_framework.exceptions import ValidationError
+
+from apps.rentals.models import Console, ConsoleType
+from apps.rentals.views import _parse_date_range
+
+
+@pytest.fixture
+def console():
+    return Console.objects.create(
+        name="PlayStation 5",
+        console_type=ConsoleType.PS5,
+        daily_price=500,
+        weekly_price=3000,
+        monthly_price=10000,
+        stock_quantity=2,
+        available_quantity=2,
+    )
+
+
+@pytest.mark.django_db
+class TestConsoleReviews:
+    def test_ignores_console_ordering_param(self, api_client, console):
+        url = reverse("rentals:console-reviews", kwargs={"slug": console.slug})
+
+        response = api_client.get(url, {"ordering": "name"})
+
+        assert response.status_code == 200
+        assert response.data["results"] == []
+
+
+class TestParseDateRange:
+    @pytest.mark.parametrize(
+        ("params", "field", "message"),
+        [
+            ({"end_date": "2024-01-05"}, "start_date", "This field may not be null."),
+            ({"start_date": "", "end_date": "2024-01-05"}, "start_date", "Date has wrong format."),
+            ({"start_date": "01/01/2024", "end_date": "2024-01-05"}, "start_date", "Date has wrong format."),
+            ({"start_date": "2024-02-30", "end_date": "2024-03-05"}, "start_date", "Date has wrong format."),
+            ({"start_date": "2024-01-05", "end_date": "2024-01-05"}, "end_date", "End date must be after"),
+        ],
+    )
+    def test_matches_availability_serializer_errors(self, params, field, message):
+        with pytest.raises(ValidationError) as excinfo:
+            _parse_date_range(params)
+
+        assert str(excinfo.value.detail[field][0]).startswith(message)
+
+    def test_returns_dates(self):
+        assert _parse_date_range({"start_date": "2024-01-01", "end_date": "2024-01-05"}) == (
+            date(2024, 1, 1),
+            date(2024, 1, 5),
+        )
@@ -13,17 +13,35 @@ Architecture
 • **Availability** — public, date-range overlap checking
 """
 
+import json
 import logging
+from datetime import datetime, timezone as dt_timezone
 
-from django_filters.rest_framework import DjangoFilterBackend
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Avg, Count, Prefetch
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_date
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import filters, generics, permissions, status, viewsets
+from rest_framework import filters, generics, mixins, permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.core.filters import LazyDjangoFilterBackend
+from apps.core.mixins import (
+    ActionSerializerMixin,
+    AutoPrefetchMixin,
+    CachedObjectMixin,
+    LastModifiedMixin,
+    ReadReplicaMixin,
+    SharedFilterBackendsMixin,
+)
+from apps.core.pagination import NewestFirstCursorPagination, StandardResultsPagination
 from apps.core.permissions import IsAdminOrReadOnly, IsOwner, IsOwnerOrReadOnly
+from apps.core.serializers import get_shared_serializer, represent_many
 
-from . import availability_service, rental_service, review_service
+from . import availability_service, catalog_service, rental_service, review_service
 from .filters import (
     AccessoryFilter,
     ConsoleFilter,
@@ -31,9 +49,18 @@ from .filters import (
     RentalFilter,
     ReviewFilter,
 )
-from .models import Accessory, Console, Game, Rental, RentalStatus, Review
+from .models import (
+    Accessory,
+    Console,
+    ConsoleImage,
+    Game,
+    Rental,
+    RentalStatus,
+    Review,
+)
 from .review_service import ReviewValidationError
 from .serializers import (
+    RENTAL_LIST_COLUMNS,
     AccessorySerializer,
     AvailabilityCheckSerializer,
     AvailabilityItemSerializer,
@@ -56,6 +83,84 @@ from .serializers import (
 logger = logging.getLogger(__name__)
 
 
+def _parse_date_range(query_params):
+    """
+    Read ``start_date`` / ``end_date`` (ISO dates) from the query string.
+
+    Same rules and error shape as ``AvailabilityCheckSerializer``, without
+    building a serializer for two scalar params.
+    """
+    errors = {}
+    dates = {}
+    for name in ("start_date", "end_date"):
+        raw = query_params.get(name)
+        if raw is None:
+            # The serializer was handed ``None`` for a missing param.
+            errors[name] = ["This field may not be null."]
+            continue
+        try:
+            # The parser behind DRF's ``DateField``, so both accept the
+            # same forms.
+            dates[name] = parse_date(raw)
+        except ValueError:
+            dates[name] = None
+        if dates[name] is None:
+            errors[name] = ["Date has wrong format. Use one of these formats instead: YYYY-MM-DD."]
+    if errors:
+        raise ValidationError(errors)
+    if dates["start_date"] >= dates["end_date"]:
+        raise ValidationError({"end_date": ["End date must be after start date."]})
+    return dates["start_date"], dates["end_date"]
+
+
+class CatalogLastModifiedMixin(LastModifiedMixin):
+    """
+    Conditional GETs for the public catalog, keyed on the catalog stamp.
+
+    Unconditional ``list`` requests are served from a page cache
+    versioned by the catalog version, and always read from the primary.
+    """
+
+    def get_last_modified(self):
+        # Stamp and version come back together; the version is kept for
+        # the ETag and the page cache key of this request.
+        last_modified, self._catalog_version = catalog_service.get_catalog_state()
+        return last_modified
+
+    def _get_catalog_version(self):
+        version = self.__dict__.get("_catalog_version")
+        if version is None:
+            version = self._catalog_version = catalog_service.get_catalog_version()
+        return version
+
+    def get_etag(self, last_modified):
+        # Finer than the one-second Last-Modified: two writes in the same
+        # second still change it.
+        return f'W/"{self._get_catalog_version()}"'
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # List pages are cached under the version the primary has just
+            # bumped; built from a lagging replica, a stale page would be
+            # pinned to the new version (and its ETag) until it expires.
+            queryset = queryset.using(DEFAULT_DB_ALIAS)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(self._cached_list, request, *args, **kwargs)
+
+    def _cached_list(self, request, *args, **kwargs):
+        # ``ListModelMixin.list`` directly — ``super().list`` would run
+        # the conditional check a second time.
+        payload = catalog_service.get_cached_catalog_page(
+            request.build_absolute_uri(),
+            lambda: mixins.ListModelMixin.list(self, request, *args, **kwargs).data,
+            version=self._get_catalog_version(),
+        )
+        return Response(payload)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # CONSOLE
 # ═══════════════════════════════════════════════════════════════════
@@ -72,7 +177,14 @@ logger = logging.getLogger(__name__)
         tags=["Consoles"],
     ),
 )
-class ConsoleViewSet(viewsets.ReadOnlyModelViewSet):
+class ConsoleViewSet(
+    CatalogLastModifiedMixin,
+    ReadReplicaMixin,
+    CachedObjectMixin,
+    ActionSerializerMixin,
+    SharedFilterBackendsMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     Public, read-only console catalog.
 
@@ -90,45 +202,98 @@ class ConsoleViewSet(viewsets.ReadOnlyModelViewSet):
     ?search=playstation  &ordering=daily_price
     """
 
-    queryset = Console.objects.filter(is_active=True).prefetch_related("images")
+    queryset = Console.objects.filter(is_active=True)
+    serializer_class = ConsoleListSerializer
+    serializer_classes = {"retrieve": ConsoleDetailSerializer}
     filterset_class = ConsoleFilter
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name", "description"]
     ordering_fields = ["daily_price", "weekly_price", "monthly_price", "created_at", "name"]
     ordering = ["-created_at"]
     permission_classes = [permissions.AllowAny]
     lookup_field = "slug"
+    # Conditional on the console's review version, not the catalog stamp.
+    review_actions = ("reviews", "review_stats")
 
-    def get_serializer_class(self):
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # List cards only show the primary image and no description; the
+        # full gallery is detail-only.  Other detail actions just need
+        # the console row.
+        if self.action == "list":
+            return queryset.defer("description").prefetch_related(
+                Prefetch(
+                    "images",
+                    queryset=ConsoleImage.objects.filter(is_primary=True),
+                    to_attr="primary_images",
+                ),
+            )
         if self.action == "retrieve":
-            return ConsoleDetailSerializer
-        return ConsoleListSerializer
-
-    @action(detail=True, methods=["get"])
+            return queryset.prefetch_related("images").annotate(
+                avg_rating=Avg("reviews__rating"),
+                review_count=Count("reviews"),
+            )
+        return queryset
+
+    # No filter backends: the cursor paginator would otherwise take its
+    # ordering from the console ``OrderingFilter`` (``?ordering=name``).
+    @action(
+        detail=True,
+        methods=["get"],
+        pagination_class=NewestFirstCursorPagination,
+        filter_backends=[],
+    )
     def reviews(self, request, slug=None):
-        """GET /consoles/{slug}/reviews/ — paginated reviews for this console."""
+        """GET /consoles/{slug}/reviews/ — cursor-paginated reviews for this console."""
+        return self._conditional(self._reviews, request, slug=slug)
+
+    def _reviews(self, request, slug=None):
         console = self.get_object()
-        reviews = (
-            Review.objects
-            .filter(console=console)
-            .select_related("user", "rental")
-            .order_by("-created_at")
+        payload = review_service.get_cached_console_reviews(
+            console,
+            request.build_absolute_uri(),
+            lambda: self._build_reviews_payload(console),
+            version=self._reviews_version,
         )
+        return Response(payload)
+
+    def _build_reviews_payload(self, console):
+        reviews = review_service.list_console_reviews(console)
         page = self.paginate_queryset(reviews)
         if page is not None:
-            serializer = ReviewListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = ReviewListSerializer(reviews, many=True)
-        return Response(serializer.data)
+            return self.get_paginated_response(represent_many(ReviewListSerializer, page)).data
+        return represent_many(ReviewListSerializer, reviews)
+
+    def get_last_modified(self):
+        if self.action not in self.review_actions:
+            return super().get_last_modified()
+        # Review pages change only with the console's own reviews; the
+        # catalog stamp also moves on every booking, cancel and return.
+        self._reviews_version = review_service.get_console_reviews_version(
+            self.get_object().pk,
+        )
+        # Round up like the catalog stamp: HTTP dates are whole seconds.
+        return datetime.fromtimestamp(
+            self._reviews_version // 10**9 + 1, tz=dt_timezone.utc,
+        )
+
+    def get_etag(self, last_modified):
+        if self.action not in self.review_actions:
+            return super().get_etag(last_modified)
+        return f'W/"rev-{self._reviews_version}"'
 
     @action(detail=True, methods=["get"], url_path="review-stats")
     def review_stats(self, request, slug=None):
         """GET /consoles/{slug}/review-stats/ — aggregate rating stats."""
+        return self._conditional(self._review_stats, request, slug=slug)
+
+    def _review_stats(self, request, slug=None):
         console = self.get_object()
         stats = review_service.get_console_review_stats(console)
         serializer = ReviewStatsSerializer(stats)
         return Response(serializer.data)
 
+    @extend_schema(responses=AvailabilityItemSerializer)
     @action(detail=True, methods=["get"], url_path="check-availability")
     def check_availability(self, request, slug=None):
         """
@@ -139,19 +304,12 @@ class ConsoleViewSet(viewsets.ReadOnlyModelViewSet):
         Returns an availability verdict with stock / overlap details.
         """
         console = self.get_object()
-        serializer = AvailabilityCheckSerializer(data={
-            "console_id": console.pk,
-            "start_date": request.query_params.get("start_date"),
-            "end_date": request.query_params.get("end_date"),
-        })
-        serializer.is_valid(raise_exception=True)
+        start, end = _parse_date_range(request.query_params)
 
         result = availability_service.check_console_availability(
-            console=console,
-            start=serializer.validated_data["start_date"],
-            end=serializer.validated_data["end_date"],
+            console=console, start=start, end=end,
         )
-        return Response(AvailabilityItemSerializer(result).data)
+        return Response(result.as_dict())
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -170,7 +328,13 @@ class ConsoleViewSet(viewsets.ReadOnlyModelViewSet):
         tags=["Games"],
     ),
 )
-class GameViewSet(viewsets.ReadOnlyModelViewSet):
+class GameViewSet(
+    CatalogLastModifiedMixin,
+    ReadReplicaMixin,
+    ActionSerializerMixin,
+    SharedFilterBackendsMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     Public, read-only game catalog.
 
@@ -187,18 +351,22 @@ class GameViewSet(viewsets.ReadOnlyModelViewSet):
     """
 
     queryset = Game.objects.filter(is_active=True)
+    serializer_class = GameListSerializer
+    serializer_classes = {"retrieve": GameDetailSerializer}
     filterset_class = GameFilter
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["title", "description"]
     ordering_fields = ["daily_price", "weekly_price", "rating", "created_at", "title"]
     ordering = ["-created_at"]
     permission_classes = [permissions.AllowAny]
     lookup_field = "slug"
 
-    def get_serializer_class(self):
-        if self.action == "retrieve":
-            return GameDetailSerializer
-        return GameListSerializer
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # List cards don't render the long-form description.
+        if self.action == "list":
+            return queryset.defer("description")
+        return queryset
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -217,7 +385,12 @@ class GameViewSet(viewsets.ReadOnlyModelViewSet):
         tags=["Accessories"],
     ),
 )
-class AccessoryViewSet(viewsets.ReadOnlyModelViewSet):
+class AccessoryViewSet(
+    CatalogLastModifiedMixin,
+    ReadReplicaMixin,
+    SharedFilterBackendsMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     Public, read-only accessory catalog.
 
@@ -235,7 +408,7 @@ class AccessoryViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Accessory.objects.filter(is_active=True)
     serializer_class = AccessorySerializer
     filterset_class = AccessoryFilter
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name", "description"]
     ordering_fields = ["price_per_day", "created_at", "name"]
     ordering = ["-created_at"]
@@ -264,7 +437,13 @@ class AccessoryViewSet(viewsets.ReadOnlyModelViewSet):
         tags=["Rentals"],
     ),
 )
-class RentalViewSet(viewsets.ModelViewSet):
+class RentalViewSet(
+    CachedObjectMixin,
+    ActionSerializerMixin,
+    AutoPrefetchMixin,
+    SharedFilterBackendsMixin,
+    viewsets.ModelViewSet,
+):
     """
     Authenticated user's rental bookings.
 
@@ -286,27 +465,53 @@ class RentalViewSet(viewsets.ModelViewSet):
     ?ordering=-rental_start_date
     """
 
+    queryset = Rental.objects.all()
+    serializer_class = RentalListSerializer
+    serializer_classes = {
+        "create": RentalCreateSerializer,
+        "retrieve": RentalDetailSerializer,
+        # Loads the rental with the detail prefetches it responds with.
+        "return_rental": RentalDetailSerializer,
+    }
     http_method_names = ["get", "post", "head", "options"]
     permission_classes = [permissions.IsAuthenticated, IsOwner]
     filterset_class = RentalFilter
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
     search_fields = ["rental_number", "console__name"]
     ordering_fields = ["created_at", "rental_start_date", "rental_end_date", "total_price"]
     ordering = ["-created_at"]
+    pagination_class = NewestFirstCursorPagination
+    # Detail view: nested game cards skip the long-form description.
+    prefetch_querysets = {
+        "games": Game.objects.defer("description", "is_active"),
+    }
 
     def get_queryset(self):
-        return (
-            Rental.objects.filter(user=self.request.user)
-            .select_related("console")
-            .prefetch_related("games", "accessories")
-        )
+        queryset = super().get_queryset().filter(user=self.request.user)
+        if self.action == "list":
+            queryset = queryset.only(*RENTAL_LIST_COLUMNS)
+        if self.action == "late_fee":
+            queryset = rental_service.with_late_fee_per_day(queryset)
+        if self.action in ("retrieve", "return_rental"):
+            # The nested console card reads its primary image through a
+            # method field, which the auto-derived lookups can't see.
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "console__images",
+                    queryset=ConsoleImage.objects.filter(is_primary=True),
+                    to_attr="primary_images",
+                ),
+            )
+        return queryset
 
-    def get_serializer_class(self):
-        if self.action == "create":
-            return RentalCreateSerializer
-        if self.action == "retrieve":
-            return RentalDetailSerializer
-        return RentalListSerializer
+    def list(self, request, *args, **kwargs):
+        # Rows go through the shared, precompiled list serializer instead
+        # of a ListSerializer built for every request.
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(represent_many(RentalListSerializer, page))
+        return Response(represent_many(RentalListSerializer, queryset))
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -338,6 +543,7 @@ class RentalViewSet(viewsets.ModelViewSet):
         )
 
     # ── Return a rental ──────────────────────────────────────────
+    @extend_schema(request=None, responses=RentalDetailSerializer)
     @action(detail=True, methods=["post"])
     def return_rental(self, request, pk=None):
         rental = self.get_object()
@@ -404,7 +610,13 @@ class RentalViewSet(viewsets.ModelViewSet):
         tags=["Reviews"],
     ),
 )
-class ReviewViewSet(viewsets.GenericViewSet):
+class ReviewViewSet(
+    CachedObjectMixin,
+    ActionSerializerMixin,
+    AutoPrefetchMixin,
+    SharedFilterBackendsMixin,
+    viewsets.GenericViewSet,
+):
     """
     Full CRUD for reviews — business logic delegated to ``review_service``.
 
@@ -416,33 +628,36 @@ class ReviewViewSet(viewsets.GenericViewSet):
     PATCH  /reviews/{id}/            → partial update
     DELETE /reviews/{id}/            → destroy
     GET    /reviews/reviewable/      → rentals the user can still review
+    GET    /reviews/export/          → own reviews as streamed NDJSON
     """
 
+    queryset = Review.objects.all()
+    serializer_class = ReviewListSerializer
+    serializer_classes = {
+        "create": ReviewCreateSerializer,
+        "partial_update": ReviewUpdateSerializer,
+        "update": ReviewUpdateSerializer,
+        "retrieve": ReviewDetailSerializer,
+    }
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = "id"
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ReviewFilter
     search_fields = ["title", "comment"]
     ordering_fields = ["created_at", "rating", "helpful_count"]
     ordering = ["-created_at"]
+    pagination_class = NewestFirstCursorPagination
 
     def get_queryset(self):
+        # ``ReviewDetailSerializer.console_name`` is a SerializerMethodField,
+        # invisible to the auto-prefetch walk — select it explicitly.
         return (
-            Review.objects
+            super().get_queryset()
             .filter(user=self.request.user)
-            .select_related("rental", "console", "user")
+            .select_related("console")
             .order_by("-created_at")
         )
 
-    def get_serializer_class(self):
-        if self.action == "create":
-            return ReviewCreateSerializer
-        if self.action in ("partial_update", "update"):
-            return ReviewUpdateSerializer
-        if self.action == "retrieve":
-            return ReviewDetailSerializer
-        return ReviewListSerializer
-
     # ── CREATE ───────────────────────────────────────────────────
 
     def create(self, request):
@@ -473,13 +688,11 @@ class ReviewViewSet(viewsets.GenericViewSet):
 
     def list(self, request):
         """GET /reviews/ — list the authenticated user's reviews."""
-        queryset = self.get_queryset()
+        queryset = review_service.review_list_rows(self.get_queryset())
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = ReviewListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = ReviewListSerializer(queryset, many=True)
-        return Response(serializer.data)
+            return self.get_paginated_response(represent_many(ReviewListSerializer, page))
+        return Response(represent_many(ReviewListSerializer, queryset))
 
     # ── RETRIEVE ─────────────────────────────────────────────────
 
@@ -526,7 +739,8 @@ class ReviewViewSet(viewsets.GenericViewSet):
 
     # ── REVIEWABLE RENTALS ───────────────────────────────────────
 
-    @action(detail=False, methods=["get"])
+    # Ordered by return date, not ``created_at`` — keep page numbers.
+    @action(detail=False, methods=["get"], pagination_class=StandardResultsPagination)
     def reviewable(self, request):
         """
         GET /reviews/reviewable/
@@ -535,10 +749,28 @@ class ReviewViewSet(viewsets.GenericViewSet):
         rentals = review_service.get_reviewable_rentals(request.user)
         page = self.paginate_queryset(rentals)
         if page is not None:
-            serializer = ReviewableRentalSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = ReviewableRentalSerializer(rentals, many=True)
-        return Response(serializer.data)
+            return self.get_paginated_response(represent_many(ReviewableRentalSerializer, page))
+        return Response(represent_many(ReviewableRentalSerializer, rentals))
+
+    # ── EXPORT ───────────────────────────────────────────────────
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        GET /reviews/export/ — every review of the user as NDJSON.
+
+        Rows are streamed newest first in keyset batches, so memory stays
+        flat regardless of how many reviews the user has — server-side
+        cursors are off behind PgBouncer.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = get_shared_serializer(ReviewListSerializer)
+
+        def rows():
+            for review in review_service.iter_review_rows(queryset):
+                yield json.dumps(serializer.to_representation(review), cls=JSONEncoder) + "\n"
+
+        return StreamingHttpResponse(rows(), content_type="application/x-ndjson")
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -552,6 +784,7 @@ class ReviewViewSet(viewsets.GenericViewSet):
         "for a given date range. Returns per-item verdicts and a top-level "
         "``all_available`` flag."
     ),
+    responses=BulkAvailabilitySerializer,
     tags=["Availability"],
 )
 class AvailabilityCheckView(generics.GenericAPIView):
@@ -588,6 +821,7 @@ class AvailabilityCheckView(generics.GenericAPIView):
             accessories=data.get("accessory_ids", []),
             start=data["start_date"],
             end=data["end_date"],
+            cached=True,
         )
 
-        return Response(BulkAvailabilitySerializer(result).data)
+        return Response(result.as_dict())
@@ -10,6 +10,13 @@ class AccountAdapter(DefaultAccountAdapter):
         frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:3000")
         return f"{frontend_url}/auth/verify-email/{emailconfirmation.key}"
 
+    def save_user(self, request, user, form, commit=True):
+        """Set the extra signup fields so they land in the initial INSERT."""
+        data = form.cleaned_data
+        user.full_name = data.get("full_name", "")
+        user.phone_number = data.get("phone_number", "")
+        return super().save_user(request, user, form, commit=commit)
+
     def send_mail(self, template_prefix, email, context):
         """Override to customize email sending."""
         context["site_name"] = "Corner Console"
@@ -0,0 +1,54 @@
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+AUTH_USER_CACHE_TIMEOUT = 60  # seconds
+# Cached alongside the pk: what permission checks read on every request.
+AUTH_USER_CACHED_FIELDS = ("is_active", "is_staff", "is_superuser")
+
+
+def _user_cache_key(user_id) -> str:
+    return f"auth:user:{user_id}"
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop the cached auth user once the current transaction commits."""
+    transaction.on_commit(lambda: cache.delete(_user_cache_key(user_id)))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    ``JWTAuthentication`` that caches the token's user for a short while.
+
+    Every authenticated request otherwise SELECTs the user row.  Only the
+    columns permission checks read are cached — never the password hash
+    or profile data — and the user is rebuilt from them with every other
+    field deferred, so e.g. ``request.user.email`` loads on first access.
+    Only users that passed the stock checks (exists, active) are cached,
+    and the entry is dropped whenever the user is saved or deleted (see
+    ``signals``), so deactivation and password changes apply immediately.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            return super().get_user(validated_token)
+
+        key = _user_cache_key(user_id)
+        cached = cache.get(key)
+        if cached is not None:
+            field_names = [
+                field.attname
+                for field in self.user_model._meta.concrete_fields
+                if field.attname in cached
+            ]
+            return self.user_model.from_db(
+                DEFAULT_DB_ALIAS, field_names, [cached[name] for name in field_names],
+            )
+
+        user = super().get_user(validated_token)
+        fields = (user._meta.pk.attname, *AUTH_USER_CACHED_FIELDS)
+        cache.set(key, {name: getattr(user, name) for name in fields}, AUTH_USER_CACHE_TIMEOUT)
+        return user
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models.functions import Cast, Upper
 
 from apps.core.models import UUIDModel
 
@@ -23,7 +24,6 @@ class User(UUIDModel, AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(
         "email address",
         unique=True,
-        db_index=True,
         error_messages={"unique": "A user with this email already exists."},
     )
     full_name = models.CharField("full name", max_length=255, blank=True)
@@ -68,7 +68,10 @@ class User(UUIDModel, AbstractBaseUser, PermissionsMixin):
         verbose_name_plural = "users"
         ordering = ["-date_joined"]
         indexes = [
-            models.Index(fields=["email"], name="idx_user_email"),
+            # Matches the ``UPPER(email::text)`` Postgres emits for the
+            # ``email__iexact`` login lookup; ``unique`` already covers
+            # exact matches.
+            models.Index(Upper(Cast("email", models.TextField())), name="idx_user_email_upper"),
             models.Index(fields=["is_active", "is_verified"], name="idx_user_status"),
         ]
 
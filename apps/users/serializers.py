@@ -1,10 +1,12 @@
 from dj_rest_auth.registration.serializers import RegisterSerializer
 from rest_framework import serializers
 
+from apps.core.serializers import CachedFieldsMixin
+
 from .models import User, UserProfile
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = UserProfile
         fields = [
@@ -15,7 +17,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ["stripe_customer_id"]
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     profile = UserProfileSerializer(read_only=True)
 
     class Meta:
@@ -34,11 +36,19 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "email", "is_verified", "date_joined"]
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["full_name", "phone_number", "address", "avatar"]
 
+    def update(self, instance, validated_data):
+        # Write only the submitted columns — a PATCH usually sends one or
+        # two — instead of rewriting the whole user row.
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
 
 class CustomRegisterSerializer(RegisterSerializer):
     username = None
@@ -54,10 +64,3 @@ class CustomRegisterSerializer(RegisterSerializer):
             }
         )
         return data
-
-    def save(self, request):
-        user = super().save(request)
-        user.full_name = self.cleaned_data.get("full_name", "")
-        user.phone_number = self.cleaned_data.get("phone_number", "")
-        user.save(update_fields=["full_name", "phone_number"])
-        return user
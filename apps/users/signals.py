@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from .models import UserProfile
@@ -14,6 +14,20 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def save_user_profile(sender, instance, **kwargs):
-    """Save UserProfile when User is saved."""
-    if hasattr(instance, "profile"):
+    """
+    Save the UserProfile along with the User — only if it was loaded.
+
+    A profile nobody touched has nothing to save; checking ``hasattr``
+    would fetch it (and then rewrite it) on every user save.
+    """
+    if sender.profile.is_cached(instance):
         instance.profile.save()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_auth_user(sender, instance, **kwargs):
+    """Drop the user cached by ``CachedJWTAuthentication``."""
+    from .authentication import invalidate_cached_user
+
+    invalidate_cached_user(instance.pk)
@@ -14,15 +14,17 @@ Endpoints
 • ``DELETE /me/delete/``              → soft-delete (deactivate) account
 """
 
-from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import filters, generics, permissions, serializers, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.filters import LazyDjangoFilterBackend
+from apps.core.mixins import AutoPrefetchMixin
+from apps.core.serializers import represent_many
 from apps.rentals.filters import RentalFilter
 from apps.rentals.models import Rental
-from apps.rentals.serializers import RentalListSerializer
+from apps.rentals.serializers import RENTAL_LIST_COLUMNS, RentalListSerializer
 
 from .models import UserProfile
 from .serializers import UserProfileSerializer, UserSerializer, UserUpdateSerializer
@@ -59,8 +61,14 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
-        profile, _ = UserProfile.objects.get_or_create(user=self.request.user)
-        return profile
+        # Reading through the reverse accessor caches the profile on
+        # request.user for the rest of the request.
+        user = self.request.user
+        try:
+            return user.profile
+        except UserProfile.DoesNotExist:
+            profile, _ = UserProfile.objects.get_or_create(user=user)
+            return profile
 
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -103,7 +111,7 @@ class ChangePasswordView(APIView):
 
 
 @extend_schema(tags=["Users"])
-class UserRentalHistoryView(generics.ListAPIView):
+class UserRentalHistoryView(AutoPrefetchMixin, generics.ListAPIView):
     """
     GET /api/v1/auth/me/rentals/
 
@@ -112,9 +120,10 @@ class UserRentalHistoryView(generics.ListAPIView):
     (status, rental_type, payment_status, date ranges, etc.).
     """
 
+    queryset = Rental.objects.all()
     serializer_class = RentalListSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = RentalFilter
     search_fields = ["rental_number"]
     ordering_fields = ["created_at", "rental_start_date", "total_price", "status"]
@@ -122,12 +131,18 @@ class UserRentalHistoryView(generics.ListAPIView):
 
     def get_queryset(self):
         return (
-            Rental.objects
+            super().get_queryset()
             .filter(user=self.request.user)
-            .select_related("user", "console")
-            .prefetch_related("games", "accessories")
+            .only(*RENTAL_LIST_COLUMNS)
         )
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(represent_many(RentalListSerializer, page))
+        return Response(represent_many(RentalListSerializer, queryset))
+
 
 @extend_schema(tags=["Users"])
 class DeleteAccountView(APIView):
@@ -39,9 +39,14 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 # DRF (Add browsable API in dev)
 # ========================
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [  # noqa: F405
-    "rest_framework.renderers.JSONRenderer",
+    "apps.core.renderers.ORJSONRenderer",
     "rest_framework.renderers.BrowsableAPIRenderer",
 ]
+# Lets the browsable API use the admin login session.
+REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"] = [  # noqa: F405
+    *REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"],  # noqa: F405
+    "rest_framework.authentication.SessionAuthentication",
+]
 
 # ========================
 # CORS (Allow all in dev)
@@ -49,11 +54,12 @@ REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [  # noqa: F405
 CORS_ALLOW_ALL_ORIGINS = True
 
 # ========================
-# CACHING (local memory in dev)
+# CACHING (Redis, shared by runserver and the Celery worker)
 # ========================
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("REDIS_URL", default="redis://localhost:6379/2"),  # noqa: F405
     }
 }
 
@@ -14,6 +14,7 @@ Checklist before deploying:
 """
 
 import sentry_sdk
+from botocore.config import Config as BotoConfig
 from sentry_sdk.integrations.celery import CeleryIntegration
 from sentry_sdk.integrations.django import DjangoIntegration
 from sentry_sdk.integrations.redis import RedisIntegration
@@ -66,6 +67,24 @@ DATABASES["default"]["OPTIONS"] = {  # noqa: F405
     "options": "-c statement_timeout=30000",  # 30 s query timeout
 }
 
+# Behind PgBouncer in transaction mode a server-side cursor (used by
+# ``.iterator()``) can't outlive the transaction's backend connection.
+if env.bool("DB_PGBOUNCER", default=False):  # noqa: F405
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True  # noqa: F405
+
+# Optional read replica for the public catalog (see ReadReplicaMixin).
+if env("DATABASE_REPLICA_URL", default=""):  # noqa: F405
+    DATABASES["replica"] = {  # noqa: F405
+        **env.db("DATABASE_REPLICA_URL"),  # noqa: F405
+        "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],  # noqa: F405
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": DATABASES["default"]["OPTIONS"],  # noqa: F405
+        "DISABLE_SERVER_SIDE_CURSORS": DATABASES["default"].get(  # noqa: F405
+            "DISABLE_SERVER_SIDE_CURSORS", False,
+        ),
+        "TEST": {"MIRROR": "default"},
+    }
+
 # ════════════════════════════════════════════════════════════════════
 # STATIC FILES — WhiteNoise (served from the app itself)
 # ════════════════════════════════════════════════════════════════════
@@ -88,6 +107,12 @@ AWS_DEFAULT_ACL = "public-read"
 AWS_S3_OBJECT_PARAMETERS = {"CacheControl": "max-age=86400"}
 AWS_QUERYSTRING_AUTH = False
 AWS_S3_FILE_OVERWRITE = False
+# The storage keeps one S3 client per thread; keep its idle TLS
+# connections alive and back off adaptively on S3 throttling (503s).
+AWS_S3_CLIENT_CONFIG = BotoConfig(
+    tcp_keepalive=True,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
 
 if AWS_STORAGE_BUCKET_NAME:
     STORAGES["default"] = {
@@ -97,6 +122,9 @@ if AWS_STORAGE_BUCKET_NAME:
 # ════════════════════════════════════════════════════════════════════
 # CACHING — Redis
 # ════════════════════════════════════════════════════════════════════
+CACHE_BACKEND = env("CACHE_BACKEND", default="django_redis.cache.RedisCache")
+REDIS_MAX_CONNECTIONS = env.int("REDIS_MAX_CONNECTIONS", default=50)
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
@@ -105,16 +133,52 @@ CACHES = {
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "IGNORE_EXCEPTIONS": True,  # degrade gracefully
+            # Fail fast to a cache miss rather than stalling a request
+            # thread on a slow or unreachable Redis.
+            "SOCKET_CONNECT_TIMEOUT": 2,  # seconds
+            "SOCKET_TIMEOUT": 2,  # seconds
+            # One pool per worker process; bounds sockets across threads.
+            "CONNECTION_POOL_KWARGS": {
+                "max_connections": REDIS_MAX_CONNECTIONS,
+                "retry_on_timeout": True,
+                # Keeps pooled connections from being silently dropped by
+                # NAT / load balancers while idle.
+                "socket_keepalive": True,
+            },
         },
     },
 }
+if CACHE_BACKEND == "django.core.cache.backends.redis.RedisCache":
+    # Django's built-in backend: every thread in a worker shares one
+    # blocking pool.  It has no IGNORE_EXCEPTIONS, so a Redis outage
+    # surfaces as errors instead of cache misses.
+    CACHES["default"]["BACKEND"] = CACHE_BACKEND
+    CACHES["default"]["OPTIONS"] = {
+        "pool_class": "redis.BlockingConnectionPool",
+        "max_connections": REDIS_MAX_CONNECTIONS,
+        "timeout": 2,  # seconds to wait for a free connection
+        "socket_connect_timeout": 2,
+        "socket_timeout": 2,
+        "socket_keepalive": True,
+    }
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
 # ════════════════════════════════════════════════════════════════════
-# EMAIL — Production SMTP
+# EMAIL — Amazon SES API (SMTP still selectable via EMAIL_BACKEND)
 # ════════════════════════════════════════════════════════════════════
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+# Each send is one HTTPS call on the connection's boto3 client (the
+# reminder batch shares a single connection) instead of an SMTP login
+# and STARTTLS handshake.
+EMAIL_BACKEND = env(
+    "EMAIL_BACKEND", default="anymail.backends.amazon_ses.EmailBackend",
+)
+ANYMAIL = {
+    "AMAZON_SES_CLIENT_PARAMS": {
+        "region_name": env("AWS_SES_REGION_NAME", default=AWS_S3_REGION_NAME),
+        "config": AWS_S3_CLIENT_CONFIG,
+    },
+}
 
 # ════════════════════════════════════════════════════════════════════
 # SENTRY — Error tracking
@@ -134,6 +198,15 @@ if SENTRY_DSN:
         environment="production",
     )
 
+# ════════════════════════════════════════════════════════════════════
+# METRICS — StatsD (optional)
+# ════════════════════════════════════════════════════════════════════
+# Same collector gunicorn reports to; "host:port", port defaults to 8125.
+STATSD_HOST = env("STATSD_HOST", default="")
+STATSD_PREFIX = env("STATSD_PREFIX", default="corner_console")
+if STATSD_HOST:
+    MIDDLEWARE.insert(0, "apps.core.middleware.LatencyMiddleware")
+
 # ════════════════════════════════════════════════════════════════════
 # LOGGING — JSON-structured, production-grade
 # ════════════════════════════════════════════════════════════════════
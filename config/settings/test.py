@@ -11,13 +11,12 @@ PASSWORD_HASHERS = [
 ]
 
 # ========================
-# IN-MEMORY DATABASE
+# DATABASE
 # ========================
+# In-memory SQLite by default; point TEST_DATABASE_URL at Postgres
+# (see ``make test-pg``) for production-like behaviour.
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
-    }
+    "default": env.db("TEST_DATABASE_URL", default="sqlite://:memory:"),  # noqa: F405
 }
 
 # ========================
@@ -3,6 +3,7 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import include, path
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -10,6 +11,15 @@ from drf_spectacular.views import (
 )
 
 
+# The schema only changes on deploy, but generating it walks every view
+# and serializer; serve a cached copy outside development.
+SCHEMA_CACHE_TIMEOUT = 60 * 15  # seconds
+
+schema_view = SpectacularAPIView.as_view()
+if not settings.DEBUG:
+    schema_view = cache_page(SCHEMA_CACHE_TIMEOUT, key_prefix="api-schema")(schema_view)
+
+
 def health_check(request):
     """Lightweight health endpoint for Docker / load-balancer probes."""
     return JsonResponse({"status": "ok"}, status=200)
@@ -27,7 +37,7 @@ urlpatterns = [
     # Allauth
     path("accounts/", include("allauth.urls")),
     # API Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", schema_view, name="schema"),
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(url_name="schema"),
@@ -5,25 +5,57 @@ Usage:
     gunicorn config.wsgi:application -c gunicorn.conf.py
 
 Environment variables you can override:
-    WEB_CONCURRENCY  — number of workers  (default: cpu_count * 2 + 1)
+    WEB_CONCURRENCY  — number of workers  (default: available CPUs * 2 + 1)
     GUNICORN_BIND    — bind address        (default: 0.0.0.0:8000)
     GUNICORN_TIMEOUT — worker timeout      (default: 120)
+    STATSD_HOST      — StatsD collector for request metrics, host:port
+                       (default: unset, metrics off)
+    WORKER_MAX_RSS_KB — recycle a worker once its peak RSS passes this
+                       (default: 512000, i.e. ~500 MB)
 """
 
+import gc
+import math
 import multiprocessing
 import os
+import resource
 
 # ─── Server Socket ──────────────────────────────────────────────
 bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
-backlog = 2048
+backlog = 4096                  # Capped by net.core.somaxconn (see docker-compose.prod.yml)
 
 # ─── Worker Processes ───────────────────────────────────────────
-workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+def _available_cpus():
+    """
+    CPUs this container may actually use.
+
+    ``cpu_count()`` reports the host's cores; a CPU limit shows up only
+    as a cgroup quota (v2 ``cpu.max``, v1 ``cfs_quota_us``/``period``).
+    """
+    cpus = multiprocessing.cpu_count()
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+    except (OSError, ValueError):
+        try:
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                quota = f.read().strip()
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = f.read().strip()
+        except OSError:
+            return cpus
+    if quota in ("max", "-1"):
+        return cpus
+    return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+
+
+workers = int(os.getenv("WEB_CONCURRENCY", _available_cpus() * 2 + 1))
 worker_class = "gthread"
 threads = 4
 worker_connections = 1000
 max_requests = 1000             # Recycle workers after 1000 requests
 max_requests_jitter = 50        # Stagger restarts to avoid thundering herd
+worker_max_rss_kb = int(os.getenv("WORKER_MAX_RSS_KB", 512_000))
 
 # ─── Timeouts ───────────────────────────────────────────────────
 timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
@@ -41,6 +73,10 @@ access_log_format = (
     '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s" %(D)sμs'
 )
 
+# ─── Metrics ────────────────────────────────────────────────────
+statsd_host = os.getenv("STATSD_HOST") or None
+statsd_prefix = os.getenv("STATSD_PREFIX", "corner_console")
+
 # ─── Process Naming ─────────────────────────────────────────────
 proc_name = "corner_console"
 
@@ -52,7 +88,20 @@ limit_request_field_size = 8190
 # ─── Server Hooks ───────────────────────────────────────────────
 def on_starting(server):
     """Called just before the master process is initialized."""
-    pass
+    if server.cfg.preload_app:
+        # Django is set up but the URLconf is imported lazily on the first
+        # request.  Import it (and with it every view, serializer and
+        # filter module) here, so workers share those pages too.
+        from django.urls import get_resolver
+
+        get_resolver().url_patterns
+
+    # The app is already preloaded here.  Collect once, then move every
+    # surviving object into the permanent generation: worker GC passes
+    # would otherwise write to those objects' headers and un-share the
+    # copy-on-write pages inherited from the master.
+    gc.collect()
+    gc.freeze()
 
 
 def post_fork(server, worker):
@@ -60,6 +109,26 @@ def post_fork(server, worker):
     server.log.info("Worker spawned (pid: %s)", worker.pid)
 
 
+def pre_request(worker, req):
+    """
+    Recycle a worker whose memory has grown past ``worker_max_rss_kb``.
+
+    Request-count recycling alone doesn't bound a leak that grows fast.
+    ``ru_maxrss`` is the peak RSS in KB on Linux; once it crosses the
+    limit the worker finishes its in-flight requests and exits, and the
+    master forks a fresh (preloaded, so cheap) replacement.
+    """
+    if not worker.alive:
+        return
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if max_rss > worker_max_rss_kb:
+        worker.log.warning(
+            "Worker %s peak RSS %s KB exceeds %s KB; recycling.",
+            worker.pid, max_rss, worker_max_rss_kb,
+        )
+        worker.alive = False
+
+
 def pre_exec(server):
     """Called just before a new master process is forked."""
     server.log.info("Forked child, re-executing.")
@@ -67,7 +136,9 @@ def pre_exec(server):
 
 def when_ready(server):
     """Called just after the server is started."""
-    server.log.info("Server is ready. Spawning workers.")
+    server.log.info(
+        "Server is ready. Spawning %s workers x %s threads.", workers, threads,
+    )
 
 
 def worker_int(worker):